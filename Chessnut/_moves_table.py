@@ -0,0 +1,1398 @@
+"""
+Precomputed rays for each type of piece from every square of the board; see
+`Chessnut.moves` for a description of the structure.
+
+This file is generated by tools/gen_moves_table.py from Chessnut.moves.gen()
+-- do not edit it by hand.
+"""
+
+MOVES = {'k': ((b'\x01', b'\x08', b'\t'),
+       (b'\x02', b'\x00', b'\x08', b'\t', b'\n'),
+       (b'\x03', b'\x01', b'\t', b'\n', b'\x0b'),
+       (b'\x04', b'\x02', b'\n', b'\x0b', b'\x0c'),
+       (b'\x05\x06', b'\x03\x02', b'\x0b', b'\x0c', b'\r'),
+       (b'\x06', b'\x04', b'\x0c', b'\r', b'\x0e'),
+       (b'\x07', b'\x05', b'\r', b'\x0e', b'\x0f'),
+       (b'\x06', b'\x0e', b'\x0f'),
+       (b'\t', b'\x01', b'\x00', b'\x10', b'\x11'),
+       (b'\n', b'\x02', b'\x01', b'\x00', b'\x08', b'\x10', b'\x11', b'\x12'),
+       (b'\x0b', b'\x03', b'\x02', b'\x01', b'\t', b'\x11', b'\x12', b'\x13'),
+       (b'\x0c', b'\x04', b'\x03', b'\x02', b'\n', b'\x12', b'\x13', b'\x14'),
+       (b'\r', b'\x05', b'\x04', b'\x03', b'\x0b', b'\x13', b'\x14', b'\x15'),
+       (b'\x0e',
+        b'\x06',
+        b'\x05',
+        b'\x04',
+        b'\x0c',
+        b'\x14',
+        b'\x15',
+        b'\x16'),
+       (b'\x0f', b'\x07', b'\x06', b'\x05', b'\r', b'\x15', b'\x16', b'\x17'),
+       (b'\x07', b'\x06', b'\x0e', b'\x16', b'\x17'),
+       (b'\x11', b'\t', b'\x08', b'\x18', b'\x19'),
+       (b'\x12', b'\n', b'\t', b'\x08', b'\x10', b'\x18', b'\x19', b'\x1a'),
+       (b'\x13', b'\x0b', b'\n', b'\t', b'\x11', b'\x19', b'\x1a', b'\x1b'),
+       (b'\x14', b'\x0c', b'\x0b', b'\n', b'\x12', b'\x1a', b'\x1b', b'\x1c'),
+       (b'\x15', b'\r', b'\x0c', b'\x0b', b'\x13', b'\x1b', b'\x1c', b'\x1d'),
+       (b'\x16', b'\x0e', b'\r', b'\x0c', b'\x14', b'\x1c', b'\x1d', b'\x1e'),
+       (b'\x17', b'\x0f', b'\x0e', b'\r', b'\x15', b'\x1d', b'\x1e', b'\x1f'),
+       (b'\x0f', b'\x0e', b'\x16', b'\x1e', b'\x1f'),
+       (b'\x19', b'\x11', b'\x10', b' ', b'!'),
+       (b'\x1a', b'\x12', b'\x11', b'\x10', b'\x18', b' ', b'!', b'"'),
+       (b'\x1b', b'\x13', b'\x12', b'\x11', b'\x19', b'!', b'"', b'#'),
+       (b'\x1c', b'\x14', b'\x13', b'\x12', b'\x1a', b'"', b'#', b'$'),
+       (b'\x1d', b'\x15', b'\x14', b'\x13', b'\x1b', b'#', b'$', b'%'),
+       (b'\x1e', b'\x16', b'\x15', b'\x14', b'\x1c', b'$', b'%', b'&'),
+       (b'\x1f', b'\x17', b'\x16', b'\x15', b'\x1d', b'%', b'&', b"'"),
+       (b'\x17', b'\x16', b'\x1e', b'&', b"'"),
+       (b'!', b'\x19', b'\x18', b'(', b')'),
+       (b'"', b'\x1a', b'\x19', b'\x18', b' ', b'(', b')', b'*'),
+       (b'#', b'\x1b', b'\x1a', b'\x19', b'!', b')', b'*', b'+'),
+       (b'$', b'\x1c', b'\x1b', b'\x1a', b'"', b'*', b'+', b','),
+       (b'%', b'\x1d', b'\x1c', b'\x1b', b'#', b'+', b',', b'-'),
+       (b'&', b'\x1e', b'\x1d', b'\x1c', b'$', b',', b'-', b'.'),
+       (b"'", b'\x1f', b'\x1e', b'\x1d', b'%', b'-', b'.', b'/'),
+       (b'\x1f', b'\x1e', b'&', b'.', b'/'),
+       (b')', b'!', b' ', b'0', b'1'),
+       (b'*', b'"', b'!', b' ', b'(', b'0', b'1', b'2'),
+       (b'+', b'#', b'"', b'!', b')', b'1', b'2', b'3'),
+       (b',', b'$', b'#', b'"', b'*', b'2', b'3', b'4'),
+       (b'-', b'%', b'$', b'#', b'+', b'3', b'4', b'5'),
+       (b'.', b'&', b'%', b'$', b',', b'4', b'5', b'6'),
+       (b'/', b"'", b'&', b'%', b'-', b'5', b'6', b'7'),
+       (b"'", b'&', b'.', b'6', b'7'),
+       (b'1', b')', b'(', b'8', b'9'),
+       (b'2', b'*', b')', b'(', b'0', b'8', b'9', b':'),
+       (b'3', b'+', b'*', b')', b'1', b'9', b':', b';'),
+       (b'4', b',', b'+', b'*', b'2', b':', b';', b'<'),
+       (b'5', b'-', b',', b'+', b'3', b';', b'<', b'='),
+       (b'6', b'.', b'-', b',', b'4', b'<', b'=', b'>'),
+       (b'7', b'/', b'.', b'-', b'5', b'=', b'>', b'?'),
+       (b'/', b'.', b'6', b'>', b'?'),
+       (b'9', b'1', b'0'),
+       (b':', b'2', b'1', b'0', b'8'),
+       (b';', b'3', b'2', b'1', b'9'),
+       (b'<', b'4', b'3', b'2', b':'),
+       (b'=', b'5', b'4', b'3', b';'),
+       (b'>', b'6', b'5', b'4', b'<'),
+       (b'?', b'7', b'6', b'5', b'='),
+       (b'7', b'6', b'>')),
+ 'q': ((b'\x01\x02\x03\x04\x05\x06\x07',
+        b'\x08\x10\x18 (08',
+        b'\t\x12\x1b$-6?'),
+       (b'\x02\x03\x04\x05\x06\x07',
+        b'\x00',
+        b'\x08',
+        b'\t\x11\x19!)19',
+        b'\n\x13\x1c%.7'),
+       (b'\x03\x04\x05\x06\x07',
+        b'\x01\x00',
+        b'\t\x10',
+        b'\n\x12\x1a"*2:',
+        b'\x0b\x14\x1d&/'),
+       (b'\x04\x05\x06\x07',
+        b'\x02\x01\x00',
+        b'\n\x11\x18',
+        b'\x0b\x13\x1b#+3;',
+        b"\x0c\x15\x1e'"),
+       (b'\x05\x06\x07',
+        b'\x03\x02\x01\x00',
+        b'\x0b\x12\x19 ',
+        b'\x0c\x14\x1c$,4<',
+        b'\r\x16\x1f'),
+       (b'\x06\x07',
+        b'\x04\x03\x02\x01\x00',
+        b'\x0c\x13\x1a!(',
+        b'\r\x15\x1d%-5=',
+        b'\x0e\x17'),
+       (b'\x07',
+        b'\x05\x04\x03\x02\x01\x00',
+        b'\r\x14\x1b")0',
+        b'\x0e\x16\x1e&.6>',
+        b'\x0f'),
+       (b'\x06\x05\x04\x03\x02\x01\x00',
+        b'\x0e\x15\x1c#*18',
+        b"\x0f\x17\x1f'/7?"),
+       (b'\t\n\x0b\x0c\r\x0e\x0f',
+        b'\x01',
+        b'\x00',
+        b'\x10\x18 (08',
+        b'\x11\x1a#,5>'),
+       (b'\n\x0b\x0c\r\x0e\x0f',
+        b'\x02',
+        b'\x01',
+        b'\x00',
+        b'\x08',
+        b'\x10',
+        b'\x11\x19!)19',
+        b'\x12\x1b$-6?'),
+       (b'\x0b\x0c\r\x0e\x0f',
+        b'\x03',
+        b'\x02',
+        b'\x01',
+        b'\t\x08',
+        b'\x11\x18',
+        b'\x12\x1a"*2:',
+        b'\x13\x1c%.7'),
+       (b'\x0c\r\x0e\x0f',
+        b'\x04',
+        b'\x03',
+        b'\x02',
+        b'\n\t\x08',
+        b'\x12\x19 ',
+        b'\x13\x1b#+3;',
+        b'\x14\x1d&/'),
+       (b'\r\x0e\x0f',
+        b'\x05',
+        b'\x04',
+        b'\x03',
+        b'\x0b\n\t\x08',
+        b'\x13\x1a!(',
+        b'\x14\x1c$,4<',
+        b"\x15\x1e'"),
+       (b'\x0e\x0f',
+        b'\x06',
+        b'\x05',
+        b'\x04',
+        b'\x0c\x0b\n\t\x08',
+        b'\x14\x1b")0',
+        b'\x15\x1d%-5=',
+        b'\x16\x1f'),
+       (b'\x0f',
+        b'\x07',
+        b'\x06',
+        b'\x05',
+        b'\r\x0c\x0b\n\t\x08',
+        b'\x15\x1c#*18',
+        b'\x16\x1e&.6>',
+        b'\x17'),
+       (b'\x07',
+        b'\x06',
+        b'\x0e\r\x0c\x0b\n\t\x08',
+        b'\x16\x1d$+29',
+        b"\x17\x1f'/7?"),
+       (b'\x11\x12\x13\x14\x15\x16\x17',
+        b'\t\x02',
+        b'\x08\x00',
+        b'\x18 (08',
+        b'\x19"+4='),
+       (b'\x12\x13\x14\x15\x16\x17',
+        b'\n\x03',
+        b'\t\x01',
+        b'\x08',
+        b'\x10',
+        b'\x18',
+        b'\x19!)19',
+        b'\x1a#,5>'),
+       (b'\x13\x14\x15\x16\x17',
+        b'\x0b\x04',
+        b'\n\x02',
+        b'\t\x00',
+        b'\x11\x10',
+        b'\x19 ',
+        b'\x1a"*2:',
+        b'\x1b$-6?'),
+       (b'\x14\x15\x16\x17',
+        b'\x0c\x05',
+        b'\x0b\x03',
+        b'\n\x01',
+        b'\x12\x11\x10',
+        b'\x1a!(',
+        b'\x1b#+3;',
+        b'\x1c%.7'),
+       (b'\x15\x16\x17',
+        b'\r\x06',
+        b'\x0c\x04',
+        b'\x0b\x02',
+        b'\x13\x12\x11\x10',
+        b'\x1b")0',
+        b'\x1c$,4<',
+        b'\x1d&/'),
+       (b'\x16\x17',
+        b'\x0e\x07',
+        b'\r\x05',
+        b'\x0c\x03',
+        b'\x14\x13\x12\x11\x10',
+        b'\x1c#*18',
+        b'\x1d%-5=',
+        b"\x1e'"),
+       (b'\x17',
+        b'\x0f',
+        b'\x0e\x06',
+        b'\r\x04',
+        b'\x15\x14\x13\x12\x11\x10',
+        b'\x1d$+29',
+        b'\x1e&.6>',
+        b'\x1f'),
+       (b'\x0f\x07',
+        b'\x0e\x05',
+        b'\x16\x15\x14\x13\x12\x11\x10',
+        b'\x1e%,3:',
+        b"\x1f'/7?"),
+       (b'\x19\x1a\x1b\x1c\x1d\x1e\x1f',
+        b'\x11\n\x03',
+        b'\x10\x08\x00',
+        b' (08',
+        b'!*3<'),
+       (b'\x1a\x1b\x1c\x1d\x1e\x1f',
+        b'\x12\x0b\x04',
+        b'\x11\t\x01',
+        b'\x10',
+        b'\x18',
+        b' ',
+        b'!)19',
+        b'"+4='),
+       (b'\x1b\x1c\x1d\x1e\x1f',
+        b'\x13\x0c\x05',
+        b'\x12\n\x02',
+        b'\x11\x08',
+        b'\x19\x18',
+        b'!(',
+        b'"*2:',
+        b'#,5>'),
+       (b'\x1c\x1d\x1e\x1f',
+        b'\x14\r\x06',
+        b'\x13\x0b\x03',
+        b'\x12\t\x00',
+        b'\x1a\x19\x18',
+        b'")0',
+        b'#+3;',
+        b'$-6?'),
+       (b'\x1d\x1e\x1f',
+        b'\x15\x0e\x07',
+        b'\x14\x0c\x04',
+        b'\x13\n\x01',
+        b'\x1b\x1a\x19\x18',
+        b'#*18',
+        b'$,4<',
+        b'%.7'),
+       (b'\x1e\x1f',
+        b'\x16\x0f',
+        b'\x15\r\x05',
+        b'\x14\x0b\x02',
+        b'\x1c\x1b\x1a\x19\x18',
+        b'$+29',
+        b'%-5=',
+        b'&/'),
+       (b'\x1f',
+        b'\x17',
+        b'\x16\x0e\x06',
+        b'\x15\x0c\x03',
+        b'\x1d\x1c\x1b\x1a\x19\x18',
+        b'%,3:',
+        b'&.6>',
+        b"'"),
+       (b'\x17\x0f\x07',
+        b'\x16\r\x04',
+        b'\x1e\x1d\x1c\x1b\x1a\x19\x18',
+        b'&-4;',
+        b"'/7?"),
+       (b'!"#$%&\'', b'\x19\x12\x0b\x04', b'\x18\x10\x08\x00', b'(08', b')2;'),
+       (b'"#$%&\'',
+        b'\x1a\x13\x0c\x05',
+        b'\x19\x11\t\x01',
+        b'\x18',
+        b' ',
+        b'(',
+        b')19',
+        b'*3<'),
+       (b"#$%&'",
+        b'\x1b\x14\r\x06',
+        b'\x1a\x12\n\x02',
+        b'\x19\x10',
+        b'! ',
+        b')0',
+        b'*2:',
+        b'+4='),
+       (b"$%&'",
+        b'\x1c\x15\x0e\x07',
+        b'\x1b\x13\x0b\x03',
+        b'\x1a\x11\x08',
+        b'"! ',
+        b'*18',
+        b'+3;',
+        b',5>'),
+       (b"%&'",
+        b'\x1d\x16\x0f',
+        b'\x1c\x14\x0c\x04',
+        b'\x1b\x12\t\x00',
+        b'#"! ',
+        b'+29',
+        b',4<',
+        b'-6?'),
+       (b"&'",
+        b'\x1e\x17',
+        b'\x1d\x15\r\x05',
+        b'\x1c\x13\n\x01',
+        b'$#"! ',
+        b',3:',
+        b'-5=',
+        b'.7'),
+       (b"'",
+        b'\x1f',
+        b'\x1e\x16\x0e\x06',
+        b'\x1d\x14\x0b\x02',
+        b'%$#"! ',
+        b'-4;',
+        b'.6>',
+        b'/'),
+       (b'\x1f\x17\x0f\x07', b'\x1e\x15\x0c\x03', b'&%$#"! ', b'.5<', b'/7?'),
+       (b')*+,-./', b'!\x1a\x13\x0c\x05', b' \x18\x10\x08\x00', b'08', b'1:'),
+       (b'*+,-./',
+        b'"\x1b\x14\r\x06',
+        b'!\x19\x11\t\x01',
+        b' ',
+        b'(',
+        b'0',
+        b'19',
+        b'2;'),
+       (b'+,-./',
+        b'#\x1c\x15\x0e\x07',
+        b'"\x1a\x12\n\x02',
+        b'!\x18',
+        b')(',
+        b'18',
+        b'2:',
+        b'3<'),
+       (b',-./',
+        b'$\x1d\x16\x0f',
+        b'#\x1b\x13\x0b\x03',
+        b'"\x19\x10',
+        b'*)(',
+        b'29',
+        b'3;',
+        b'4='),
+       (b'-./',
+        b'%\x1e\x17',
+        b'$\x1c\x14\x0c\x04',
+        b'#\x1a\x11\x08',
+        b'+*)(',
+        b'3:',
+        b'4<',
+        b'5>'),
+       (b'./',
+        b'&\x1f',
+        b'%\x1d\x15\r\x05',
+        b'$\x1b\x12\t\x00',
+        b',+*)(',
+        b'4;',
+        b'5=',
+        b'6?'),
+       (b'/',
+        b"'",
+        b'&\x1e\x16\x0e\x06',
+        b'%\x1c\x13\n\x01',
+        b'-,+*)(',
+        b'5<',
+        b'6>',
+        b'7'),
+       (b"'\x1f\x17\x0f\x07", b'&\x1d\x14\x0b\x02', b'.-,+*)(', b'6=', b'7?'),
+       (b'1234567', b')"\x1b\x14\r\x06', b'( \x18\x10\x08\x00', b'8', b'9'),
+       (b'234567',
+        b'*#\x1c\x15\x0e\x07',
+        b')!\x19\x11\t\x01',
+        b'(',
+        b'0',
+        b'8',
+        b'9',
+        b':'),
+       (b'34567',
+        b'+$\x1d\x16\x0f',
+        b'*"\x1a\x12\n\x02',
+        b') ',
+        b'10',
+        b'9',
+        b':',
+        b';'),
+       (b'4567',
+        b',%\x1e\x17',
+        b'+#\x1b\x13\x0b\x03',
+        b'*!\x18',
+        b'210',
+        b':',
+        b';',
+        b'<'),
+       (b'567',
+        b'-&\x1f',
+        b',$\x1c\x14\x0c\x04',
+        b'+"\x19\x10',
+        b'3210',
+        b';',
+        b'<',
+        b'='),
+       (b'67',
+        b".'",
+        b'-%\x1d\x15\r\x05',
+        b',#\x1a\x11\x08',
+        b'43210',
+        b'<',
+        b'=',
+        b'>'),
+       (b'7',
+        b'/',
+        b'.&\x1e\x16\x0e\x06',
+        b'-$\x1b\x12\t\x00',
+        b'543210',
+        b'=',
+        b'>',
+        b'?'),
+       (b"/'\x1f\x17\x0f\x07", b'.%\x1c\x13\n\x01', b'6543210', b'>', b'?'),
+       (b'9:;<=>?', b'1*#\x1c\x15\x0e\x07', b'0( \x18\x10\x08\x00'),
+       (b':;<=>?', b'2+$\x1d\x16\x0f', b'1)!\x19\x11\t\x01', b'0', b'8'),
+       (b';<=>?', b'3,%\x1e\x17', b'2*"\x1a\x12\n\x02', b'1(', b'98'),
+       (b'<=>?', b'4-&\x1f', b'3+#\x1b\x13\x0b\x03', b'2) ', b':98'),
+       (b'=>?', b"5.'", b'4,$\x1c\x14\x0c\x04', b'3*!\x18', b';:98'),
+       (b'>?', b'6/', b'5-%\x1d\x15\r\x05', b'4+"\x19\x10', b'<;:98'),
+       (b'?', b'7', b'6.&\x1e\x16\x0e\x06', b'5,#\x1a\x11\x08', b'=<;:98'),
+       (b"7/'\x1f\x17\x0f\x07", b'6-$\x1b\x12\t\x00', b'>=<;:98')),
+ 'n': ((b'\x11', b'\n'),
+       (b'\x10', b'\x12', b'\x0b'),
+       (b'\x08', b'\x11', b'\x13', b'\x0c'),
+       (b'\t', b'\x12', b'\x14', b'\r'),
+       (b'\n', b'\x13', b'\x15', b'\x0e'),
+       (b'\x0b', b'\x14', b'\x16', b'\x0f'),
+       (b'\x0c', b'\x15', b'\x17'),
+       (b'\r', b'\x16'),
+       (b'\x02', b'\x19', b'\x12'),
+       (b'\x03', b'\x18', b'\x1a', b'\x13'),
+       (b'\x04', b'\x00', b'\x10', b'\x19', b'\x1b', b'\x14'),
+       (b'\x05', b'\x01', b'\x11', b'\x1a', b'\x1c', b'\x15'),
+       (b'\x06', b'\x02', b'\x12', b'\x1b', b'\x1d', b'\x16'),
+       (b'\x07', b'\x03', b'\x13', b'\x1c', b'\x1e', b'\x17'),
+       (b'\x04', b'\x14', b'\x1d', b'\x1f'),
+       (b'\x05', b'\x15', b'\x1e'),
+       (b'\n', b'\x01', b'!', b'\x1a'),
+       (b'\x0b', b'\x02', b'\x00', b' ', b'"', b'\x1b'),
+       (b'\x0c', b'\x03', b'\x01', b'\x08', b'\x18', b'!', b'#', b'\x1c'),
+       (b'\r', b'\x04', b'\x02', b'\t', b'\x19', b'"', b'$', b'\x1d'),
+       (b'\x0e', b'\x05', b'\x03', b'\n', b'\x1a', b'#', b'%', b'\x1e'),
+       (b'\x0f', b'\x06', b'\x04', b'\x0b', b'\x1b', b'$', b'&', b'\x1f'),
+       (b'\x07', b'\x05', b'\x0c', b'\x1c', b'%', b"'"),
+       (b'\x06', b'\r', b'\x1d', b'&'),
+       (b'\x12', b'\t', b')', b'"'),
+       (b'\x13', b'\n', b'\x08', b'(', b'*', b'#'),
+       (b'\x14', b'\x0b', b'\t', b'\x10', b' ', b')', b'+', b'$'),
+       (b'\x15', b'\x0c', b'\n', b'\x11', b'!', b'*', b',', b'%'),
+       (b'\x16', b'\r', b'\x0b', b'\x12', b'"', b'+', b'-', b'&'),
+       (b'\x17', b'\x0e', b'\x0c', b'\x13', b'#', b',', b'.', b"'"),
+       (b'\x0f', b'\r', b'\x14', b'$', b'-', b'/'),
+       (b'\x0e', b'\x15', b'%', b'.'),
+       (b'\x1a', b'\x11', b'1', b'*'),
+       (b'\x1b', b'\x12', b'\x10', b'0', b'2', b'+'),
+       (b'\x1c', b'\x13', b'\x11', b'\x18', b'(', b'1', b'3', b','),
+       (b'\x1d', b'\x14', b'\x12', b'\x19', b')', b'2', b'4', b'-'),
+       (b'\x1e', b'\x15', b'\x13', b'\x1a', b'*', b'3', b'5', b'.'),
+       (b'\x1f', b'\x16', b'\x14', b'\x1b', b'+', b'4', b'6', b'/'),
+       (b'\x17', b'\x15', b'\x1c', b',', b'5', b'7'),
+       (b'\x16', b'\x1d', b'-', b'6'),
+       (b'"', b'\x19', b'9', b'2'),
+       (b'#', b'\x1a', b'\x18', b'8', b':', b'3'),
+       (b'$', b'\x1b', b'\x19', b' ', b'0', b'9', b';', b'4'),
+       (b'%', b'\x1c', b'\x1a', b'!', b'1', b':', b'<', b'5'),
+       (b'&', b'\x1d', b'\x1b', b'"', b'2', b';', b'=', b'6'),
+       (b"'", b'\x1e', b'\x1c', b'#', b'3', b'<', b'>', b'7'),
+       (b'\x1f', b'\x1d', b'$', b'4', b'=', b'?'),
+       (b'\x1e', b'%', b'5', b'>'),
+       (b'*', b'!', b':'),
+       (b'+', b'"', b' ', b';'),
+       (b',', b'#', b'!', b'(', b'8', b'<'),
+       (b'-', b'$', b'"', b')', b'9', b'='),
+       (b'.', b'%', b'#', b'*', b':', b'>'),
+       (b'/', b'&', b'$', b'+', b';', b'?'),
+       (b"'", b'%', b',', b'<'),
+       (b'&', b'-', b'='),
+       (b'2', b')'),
+       (b'3', b'*', b'('),
+       (b'4', b'+', b')', b'0'),
+       (b'5', b',', b'*', b'1'),
+       (b'6', b'-', b'+', b'2'),
+       (b'7', b'.', b',', b'3'),
+       (b'/', b'-', b'4'),
+       (b'.', b'5')),
+ 'b': ((b'\t\x12\x1b$-6?',),
+       (b'\x08', b'\n\x13\x1c%.7'),
+       (b'\t\x10', b'\x0b\x14\x1d&/'),
+       (b'\n\x11\x18', b"\x0c\x15\x1e'"),
+       (b'\x0b\x12\x19 ', b'\r\x16\x1f'),
+       (b'\x0c\x13\x1a!(', b'\x0e\x17'),
+       (b'\r\x14\x1b")0', b'\x0f'),
+       (b'\x0e\x15\x1c#*18',),
+       (b'\x01', b'\x11\x1a#,5>'),
+       (b'\x02', b'\x00', b'\x10', b'\x12\x1b$-6?'),
+       (b'\x03', b'\x01', b'\x11\x18', b'\x13\x1c%.7'),
+       (b'\x04', b'\x02', b'\x12\x19 ', b'\x14\x1d&/'),
+       (b'\x05', b'\x03', b'\x13\x1a!(', b"\x15\x1e'"),
+       (b'\x06', b'\x04', b'\x14\x1b")0', b'\x16\x1f'),
+       (b'\x07', b'\x05', b'\x15\x1c#*18', b'\x17'),
+       (b'\x06', b'\x16\x1d$+29'),
+       (b'\t\x02', b'\x19"+4='),
+       (b'\n\x03', b'\x08', b'\x18', b'\x1a#,5>'),
+       (b'\x0b\x04', b'\t\x00', b'\x19 ', b'\x1b$-6?'),
+       (b'\x0c\x05', b'\n\x01', b'\x1a!(', b'\x1c%.7'),
+       (b'\r\x06', b'\x0b\x02', b'\x1b")0', b'\x1d&/'),
+       (b'\x0e\x07', b'\x0c\x03', b'\x1c#*18', b"\x1e'"),
+       (b'\x0f', b'\r\x04', b'\x1d$+29', b'\x1f'),
+       (b'\x0e\x05', b'\x1e%,3:'),
+       (b'\x11\n\x03', b'!*3<'),
+       (b'\x12\x0b\x04', b'\x10', b' ', b'"+4='),
+       (b'\x13\x0c\x05', b'\x11\x08', b'!(', b'#,5>'),
+       (b'\x14\r\x06', b'\x12\t\x00', b'")0', b'$-6?'),
+       (b'\x15\x0e\x07', b'\x13\n\x01', b'#*18', b'%.7'),
+       (b'\x16\x0f', b'\x14\x0b\x02', b'$+29', b'&/'),
+       (b'\x17', b'\x15\x0c\x03', b'%,3:', b"'"),
+       (b'\x16\r\x04', b'&-4;'),
+       (b'\x19\x12\x0b\x04', b')2;'),
+       (b'\x1a\x13\x0c\x05', b'\x18', b'(', b'*3<'),
+       (b'\x1b\x14\r\x06', b'\x19\x10', b')0', b'+4='),
+       (b'\x1c\x15\x0e\x07', b'\x1a\x11\x08', b'*18', b',5>'),
+       (b'\x1d\x16\x0f', b'\x1b\x12\t\x00', b'+29', b'-6?'),
+       (b'\x1e\x17', b'\x1c\x13\n\x01', b',3:', b'.7'),
+       (b'\x1f', b'\x1d\x14\x0b\x02', b'-4;', b'/'),
+       (b'\x1e\x15\x0c\x03', b'.5<'),
+       (b'!\x1a\x13\x0c\x05', b'1:'),
+       (b'"\x1b\x14\r\x06', b' ', b'0', b'2;'),
+       (b'#\x1c\x15\x0e\x07', b'!\x18', b'18', b'3<'),
+       (b'$\x1d\x16\x0f', b'"\x19\x10', b'29', b'4='),
+       (b'%\x1e\x17', b'#\x1a\x11\x08', b'3:', b'5>'),
+       (b'&\x1f', b'$\x1b\x12\t\x00', b'4;', b'6?'),
+       (b"'", b'%\x1c\x13\n\x01', b'5<', b'7'),
+       (b'&\x1d\x14\x0b\x02', b'6='),
+       (b')"\x1b\x14\r\x06', b'9'),
+       (b'*#\x1c\x15\x0e\x07', b'(', b'8', b':'),
+       (b'+$\x1d\x16\x0f', b') ', b'9', b';'),
+       (b',%\x1e\x17', b'*!\x18', b':', b'<'),
+       (b'-&\x1f', b'+"\x19\x10', b';', b'='),
+       (b".'", b',#\x1a\x11\x08', b'<', b'>'),
+       (b'/', b'-$\x1b\x12\t\x00', b'=', b'?'),
+       (b'.%\x1c\x13\n\x01', b'>'),
+       (b'1*#\x1c\x15\x0e\x07',),
+       (b'2+$\x1d\x16\x0f', b'0'),
+       (b'3,%\x1e\x17', b'1('),
+       (b'4-&\x1f', b'2) '),
+       (b"5.'", b'3*!\x18'),
+       (b'6/', b'4+"\x19\x10'),
+       (b'7', b'5,#\x1a\x11\x08'),
+       (b'6-$\x1b\x12\t\x00',)),
+ 'r': ((b'\x01\x02\x03\x04\x05\x06\x07', b'\x08\x10\x18 (08'),
+       (b'\x02\x03\x04\x05\x06\x07', b'\x00', b'\t\x11\x19!)19'),
+       (b'\x03\x04\x05\x06\x07', b'\x01\x00', b'\n\x12\x1a"*2:'),
+       (b'\x04\x05\x06\x07', b'\x02\x01\x00', b'\x0b\x13\x1b#+3;'),
+       (b'\x05\x06\x07', b'\x03\x02\x01\x00', b'\x0c\x14\x1c$,4<'),
+       (b'\x06\x07', b'\x04\x03\x02\x01\x00', b'\r\x15\x1d%-5='),
+       (b'\x07', b'\x05\x04\x03\x02\x01\x00', b'\x0e\x16\x1e&.6>'),
+       (b'\x06\x05\x04\x03\x02\x01\x00', b"\x0f\x17\x1f'/7?"),
+       (b'\t\n\x0b\x0c\r\x0e\x0f', b'\x00', b'\x10\x18 (08'),
+       (b'\n\x0b\x0c\r\x0e\x0f', b'\x01', b'\x08', b'\x11\x19!)19'),
+       (b'\x0b\x0c\r\x0e\x0f', b'\x02', b'\t\x08', b'\x12\x1a"*2:'),
+       (b'\x0c\r\x0e\x0f', b'\x03', b'\n\t\x08', b'\x13\x1b#+3;'),
+       (b'\r\x0e\x0f', b'\x04', b'\x0b\n\t\x08', b'\x14\x1c$,4<'),
+       (b'\x0e\x0f', b'\x05', b'\x0c\x0b\n\t\x08', b'\x15\x1d%-5='),
+       (b'\x0f', b'\x06', b'\r\x0c\x0b\n\t\x08', b'\x16\x1e&.6>'),
+       (b'\x07', b'\x0e\r\x0c\x0b\n\t\x08', b"\x17\x1f'/7?"),
+       (b'\x11\x12\x13\x14\x15\x16\x17', b'\x08\x00', b'\x18 (08'),
+       (b'\x12\x13\x14\x15\x16\x17', b'\t\x01', b'\x10', b'\x19!)19'),
+       (b'\x13\x14\x15\x16\x17', b'\n\x02', b'\x11\x10', b'\x1a"*2:'),
+       (b'\x14\x15\x16\x17', b'\x0b\x03', b'\x12\x11\x10', b'\x1b#+3;'),
+       (b'\x15\x16\x17', b'\x0c\x04', b'\x13\x12\x11\x10', b'\x1c$,4<'),
+       (b'\x16\x17', b'\r\x05', b'\x14\x13\x12\x11\x10', b'\x1d%-5='),
+       (b'\x17', b'\x0e\x06', b'\x15\x14\x13\x12\x11\x10', b'\x1e&.6>'),
+       (b'\x0f\x07', b'\x16\x15\x14\x13\x12\x11\x10', b"\x1f'/7?"),
+       (b'\x19\x1a\x1b\x1c\x1d\x1e\x1f', b'\x10\x08\x00', b' (08'),
+       (b'\x1a\x1b\x1c\x1d\x1e\x1f', b'\x11\t\x01', b'\x18', b'!)19'),
+       (b'\x1b\x1c\x1d\x1e\x1f', b'\x12\n\x02', b'\x19\x18', b'"*2:'),
+       (b'\x1c\x1d\x1e\x1f', b'\x13\x0b\x03', b'\x1a\x19\x18', b'#+3;'),
+       (b'\x1d\x1e\x1f', b'\x14\x0c\x04', b'\x1b\x1a\x19\x18', b'$,4<'),
+       (b'\x1e\x1f', b'\x15\r\x05', b'\x1c\x1b\x1a\x19\x18', b'%-5='),
+       (b'\x1f', b'\x16\x0e\x06', b'\x1d\x1c\x1b\x1a\x19\x18', b'&.6>'),
+       (b'\x17\x0f\x07', b'\x1e\x1d\x1c\x1b\x1a\x19\x18', b"'/7?"),
+       (b'!"#$%&\'', b'\x18\x10\x08\x00', b'(08'),
+       (b'"#$%&\'', b'\x19\x11\t\x01', b' ', b')19'),
+       (b"#$%&'", b'\x1a\x12\n\x02', b'! ', b'*2:'),
+       (b"$%&'", b'\x1b\x13\x0b\x03', b'"! ', b'+3;'),
+       (b"%&'", b'\x1c\x14\x0c\x04', b'#"! ', b',4<'),
+       (b"&'", b'\x1d\x15\r\x05', b'$#"! ', b'-5='),
+       (b"'", b'\x1e\x16\x0e\x06', b'%$#"! ', b'.6>'),
+       (b'\x1f\x17\x0f\x07', b'&%$#"! ', b'/7?'),
+       (b')*+,-./', b' \x18\x10\x08\x00', b'08'),
+       (b'*+,-./', b'!\x19\x11\t\x01', b'(', b'19'),
+       (b'+,-./', b'"\x1a\x12\n\x02', b')(', b'2:'),
+       (b',-./', b'#\x1b\x13\x0b\x03', b'*)(', b'3;'),
+       (b'-./', b'$\x1c\x14\x0c\x04', b'+*)(', b'4<'),
+       (b'./', b'%\x1d\x15\r\x05', b',+*)(', b'5='),
+       (b'/', b'&\x1e\x16\x0e\x06', b'-,+*)(', b'6>'),
+       (b"'\x1f\x17\x0f\x07", b'.-,+*)(', b'7?'),
+       (b'1234567', b'( \x18\x10\x08\x00', b'8'),
+       (b'234567', b')!\x19\x11\t\x01', b'0', b'9'),
+       (b'34567', b'*"\x1a\x12\n\x02', b'10', b':'),
+       (b'4567', b'+#\x1b\x13\x0b\x03', b'210', b';'),
+       (b'567', b',$\x1c\x14\x0c\x04', b'3210', b'<'),
+       (b'67', b'-%\x1d\x15\r\x05', b'43210', b'='),
+       (b'7', b'.&\x1e\x16\x0e\x06', b'543210', b'>'),
+       (b"/'\x1f\x17\x0f\x07", b'6543210', b'?'),
+       (b'9:;<=>?', b'0( \x18\x10\x08\x00'),
+       (b':;<=>?', b'1)!\x19\x11\t\x01', b'8'),
+       (b';<=>?', b'2*"\x1a\x12\n\x02', b'98'),
+       (b'<=>?', b'3+#\x1b\x13\x0b\x03', b':98'),
+       (b'=>?', b'4,$\x1c\x14\x0c\x04', b';:98'),
+       (b'>?', b'5-%\x1d\x15\r\x05', b'<;:98'),
+       (b'?', b'6.&\x1e\x16\x0e\x06', b'=<;:98'),
+       (b"7/'\x1f\x17\x0f\x07", b'>=<;:98')),
+ 'p': ((),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (b'\x10\x18', b'\x11'),
+       (b'\x10', b'\x11\x19', b'\x12'),
+       (b'\x11', b'\x12\x1a', b'\x13'),
+       (b'\x12', b'\x13\x1b', b'\x14'),
+       (b'\x13', b'\x14\x1c', b'\x15'),
+       (b'\x14', b'\x15\x1d', b'\x16'),
+       (b'\x15', b'\x16\x1e', b'\x17'),
+       (b'\x16', b'\x17\x1f'),
+       (b'\x18', b'\x19'),
+       (b'\x18', b'\x19', b'\x1a'),
+       (b'\x19', b'\x1a', b'\x1b'),
+       (b'\x1a', b'\x1b', b'\x1c'),
+       (b'\x1b', b'\x1c', b'\x1d'),
+       (b'\x1c', b'\x1d', b'\x1e'),
+       (b'\x1d', b'\x1e', b'\x1f'),
+       (b'\x1e', b'\x1f'),
+       (b' ', b'!'),
+       (b' ', b'!', b'"'),
+       (b'!', b'"', b'#'),
+       (b'"', b'#', b'$'),
+       (b'#', b'$', b'%'),
+       (b'$', b'%', b'&'),
+       (b'%', b'&', b"'"),
+       (b'&', b"'"),
+       (b'(', b')'),
+       (b'(', b')', b'*'),
+       (b')', b'*', b'+'),
+       (b'*', b'+', b','),
+       (b'+', b',', b'-'),
+       (b',', b'-', b'.'),
+       (b'-', b'.', b'/'),
+       (b'.', b'/'),
+       (b'0', b'1'),
+       (b'0', b'1', b'2'),
+       (b'1', b'2', b'3'),
+       (b'2', b'3', b'4'),
+       (b'3', b'4', b'5'),
+       (b'4', b'5', b'6'),
+       (b'5', b'6', b'7'),
+       (b'6', b'7'),
+       (b'8', b'9'),
+       (b'8', b'9', b':'),
+       (b'9', b':', b';'),
+       (b':', b';', b'<'),
+       (b';', b'<', b'='),
+       (b'<', b'=', b'>'),
+       (b'=', b'>', b'?'),
+       (b'>', b'?'),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (),
+       ()),
+ 'P': ((),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (b'\x01', b'\x00'),
+       (b'\x02', b'\x01', b'\x00'),
+       (b'\x03', b'\x02', b'\x01'),
+       (b'\x04', b'\x03', b'\x02'),
+       (b'\x05', b'\x04', b'\x03'),
+       (b'\x06', b'\x05', b'\x04'),
+       (b'\x07', b'\x06', b'\x05'),
+       (b'\x07', b'\x06'),
+       (b'\t', b'\x08'),
+       (b'\n', b'\t', b'\x08'),
+       (b'\x0b', b'\n', b'\t'),
+       (b'\x0c', b'\x0b', b'\n'),
+       (b'\r', b'\x0c', b'\x0b'),
+       (b'\x0e', b'\r', b'\x0c'),
+       (b'\x0f', b'\x0e', b'\r'),
+       (b'\x0f', b'\x0e'),
+       (b'\x11', b'\x10'),
+       (b'\x12', b'\x11', b'\x10'),
+       (b'\x13', b'\x12', b'\x11'),
+       (b'\x14', b'\x13', b'\x12'),
+       (b'\x15', b'\x14', b'\x13'),
+       (b'\x16', b'\x15', b'\x14'),
+       (b'\x17', b'\x16', b'\x15'),
+       (b'\x17', b'\x16'),
+       (b'\x19', b'\x18'),
+       (b'\x1a', b'\x19', b'\x18'),
+       (b'\x1b', b'\x1a', b'\x19'),
+       (b'\x1c', b'\x1b', b'\x1a'),
+       (b'\x1d', b'\x1c', b'\x1b'),
+       (b'\x1e', b'\x1d', b'\x1c'),
+       (b'\x1f', b'\x1e', b'\x1d'),
+       (b'\x1f', b'\x1e'),
+       (b'!', b' '),
+       (b'"', b'!', b' '),
+       (b'#', b'"', b'!'),
+       (b'$', b'#', b'"'),
+       (b'%', b'$', b'#'),
+       (b'&', b'%', b'$'),
+       (b"'", b'&', b'%'),
+       (b"'", b'&'),
+       (b')', b'( '),
+       (b'*', b')!', b'('),
+       (b'+', b'*"', b')'),
+       (b',', b'+#', b'*'),
+       (b'-', b',$', b'+'),
+       (b'.', b'-%', b','),
+       (b'/', b'.&', b'-'),
+       (b"/'", b'.'),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (),
+       (),
+       ()),
+ 'K': ((b'\x01', b'\x08', b'\t'),
+       (b'\x02', b'\x00', b'\x08', b'\t', b'\n'),
+       (b'\x03', b'\x01', b'\t', b'\n', b'\x0b'),
+       (b'\x04', b'\x02', b'\n', b'\x0b', b'\x0c'),
+       (b'\x05', b'\x03', b'\x0b', b'\x0c', b'\r'),
+       (b'\x06', b'\x04', b'\x0c', b'\r', b'\x0e'),
+       (b'\x07', b'\x05', b'\r', b'\x0e', b'\x0f'),
+       (b'\x06', b'\x0e', b'\x0f'),
+       (b'\t', b'\x01', b'\x00', b'\x10', b'\x11'),
+       (b'\n', b'\x02', b'\x01', b'\x00', b'\x08', b'\x10', b'\x11', b'\x12'),
+       (b'\x0b', b'\x03', b'\x02', b'\x01', b'\t', b'\x11', b'\x12', b'\x13'),
+       (b'\x0c', b'\x04', b'\x03', b'\x02', b'\n', b'\x12', b'\x13', b'\x14'),
+       (b'\r', b'\x05', b'\x04', b'\x03', b'\x0b', b'\x13', b'\x14', b'\x15'),
+       (b'\x0e',
+        b'\x06',
+        b'\x05',
+        b'\x04',
+        b'\x0c',
+        b'\x14',
+        b'\x15',
+        b'\x16'),
+       (b'\x0f', b'\x07', b'\x06', b'\x05', b'\r', b'\x15', b'\x16', b'\x17'),
+       (b'\x07', b'\x06', b'\x0e', b'\x16', b'\x17'),
+       (b'\x11', b'\t', b'\x08', b'\x18', b'\x19'),
+       (b'\x12', b'\n', b'\t', b'\x08', b'\x10', b'\x18', b'\x19', b'\x1a'),
+       (b'\x13', b'\x0b', b'\n', b'\t', b'\x11', b'\x19', b'\x1a', b'\x1b'),
+       (b'\x14', b'\x0c', b'\x0b', b'\n', b'\x12', b'\x1a', b'\x1b', b'\x1c'),
+       (b'\x15', b'\r', b'\x0c', b'\x0b', b'\x13', b'\x1b', b'\x1c', b'\x1d'),
+       (b'\x16', b'\x0e', b'\r', b'\x0c', b'\x14', b'\x1c', b'\x1d', b'\x1e'),
+       (b'\x17', b'\x0f', b'\x0e', b'\r', b'\x15', b'\x1d', b'\x1e', b'\x1f'),
+       (b'\x0f', b'\x0e', b'\x16', b'\x1e', b'\x1f'),
+       (b'\x19', b'\x11', b'\x10', b' ', b'!'),
+       (b'\x1a', b'\x12', b'\x11', b'\x10', b'\x18', b' ', b'!', b'"'),
+       (b'\x1b', b'\x13', b'\x12', b'\x11', b'\x19', b'!', b'"', b'#'),
+       (b'\x1c', b'\x14', b'\x13', b'\x12', b'\x1a', b'"', b'#', b'$'),
+       (b'\x1d', b'\x15', b'\x14', b'\x13', b'\x1b', b'#', b'$', b'%'),
+       (b'\x1e', b'\x16', b'\x15', b'\x14', b'\x1c', b'$', b'%', b'&'),
+       (b'\x1f', b'\x17', b'\x16', b'\x15', b'\x1d', b'%', b'&', b"'"),
+       (b'\x17', b'\x16', b'\x1e', b'&', b"'"),
+       (b'!', b'\x19', b'\x18', b'(', b')'),
+       (b'"', b'\x1a', b'\x19', b'\x18', b' ', b'(', b')', b'*'),
+       (b'#', b'\x1b', b'\x1a', b'\x19', b'!', b')', b'*', b'+'),
+       (b'$', b'\x1c', b'\x1b', b'\x1a', b'"', b'*', b'+', b','),
+       (b'%', b'\x1d', b'\x1c', b'\x1b', b'#', b'+', b',', b'-'),
+       (b'&', b'\x1e', b'\x1d', b'\x1c', b'$', b',', b'-', b'.'),
+       (b"'", b'\x1f', b'\x1e', b'\x1d', b'%', b'-', b'.', b'/'),
+       (b'\x1f', b'\x1e', b'&', b'.', b'/'),
+       (b')', b'!', b' ', b'0', b'1'),
+       (b'*', b'"', b'!', b' ', b'(', b'0', b'1', b'2'),
+       (b'+', b'#', b'"', b'!', b')', b'1', b'2', b'3'),
+       (b',', b'$', b'#', b'"', b'*', b'2', b'3', b'4'),
+       (b'-', b'%', b'$', b'#', b'+', b'3', b'4', b'5'),
+       (b'.', b'&', b'%', b'$', b',', b'4', b'5', b'6'),
+       (b'/', b"'", b'&', b'%', b'-', b'5', b'6', b'7'),
+       (b"'", b'&', b'.', b'6', b'7'),
+       (b'1', b')', b'(', b'8', b'9'),
+       (b'2', b'*', b')', b'(', b'0', b'8', b'9', b':'),
+       (b'3', b'+', b'*', b')', b'1', b'9', b':', b';'),
+       (b'4', b',', b'+', b'*', b'2', b':', b';', b'<'),
+       (b'5', b'-', b',', b'+', b'3', b';', b'<', b'='),
+       (b'6', b'.', b'-', b',', b'4', b'<', b'=', b'>'),
+       (b'7', b'/', b'.', b'-', b'5', b'=', b'>', b'?'),
+       (b'/', b'.', b'6', b'>', b'?'),
+       (b'9', b'1', b'0'),
+       (b':', b'2', b'1', b'0', b'8'),
+       (b';', b'3', b'2', b'1', b'9'),
+       (b'<', b'4', b'3', b'2', b':'),
+       (b'=>', b'5', b'4', b'3', b';:'),
+       (b'>', b'6', b'5', b'4', b'<'),
+       (b'?', b'7', b'6', b'5', b'='),
+       (b'7', b'6', b'>')),
+ 'Q': ((b'\x01\x02\x03\x04\x05\x06\x07',
+        b'\x08\x10\x18 (08',
+        b'\t\x12\x1b$-6?'),
+       (b'\x02\x03\x04\x05\x06\x07',
+        b'\x00',
+        b'\x08',
+        b'\t\x11\x19!)19',
+        b'\n\x13\x1c%.7'),
+       (b'\x03\x04\x05\x06\x07',
+        b'\x01\x00',
+        b'\t\x10',
+        b'\n\x12\x1a"*2:',
+        b'\x0b\x14\x1d&/'),
+       (b'\x04\x05\x06\x07',
+        b'\x02\x01\x00',
+        b'\n\x11\x18',
+        b'\x0b\x13\x1b#+3;',
+        b"\x0c\x15\x1e'"),
+       (b'\x05\x06\x07',
+        b'\x03\x02\x01\x00',
+        b'\x0b\x12\x19 ',
+        b'\x0c\x14\x1c$,4<',
+        b'\r\x16\x1f'),
+       (b'\x06\x07',
+        b'\x04\x03\x02\x01\x00',
+        b'\x0c\x13\x1a!(',
+        b'\r\x15\x1d%-5=',
+        b'\x0e\x17'),
+       (b'\x07',
+        b'\x05\x04\x03\x02\x01\x00',
+        b'\r\x14\x1b")0',
+        b'\x0e\x16\x1e&.6>',
+        b'\x0f'),
+       (b'\x06\x05\x04\x03\x02\x01\x00',
+        b'\x0e\x15\x1c#*18',
+        b"\x0f\x17\x1f'/7?"),
+       (b'\t\n\x0b\x0c\r\x0e\x0f',
+        b'\x01',
+        b'\x00',
+        b'\x10\x18 (08',
+        b'\x11\x1a#,5>'),
+       (b'\n\x0b\x0c\r\x0e\x0f',
+        b'\x02',
+        b'\x01',
+        b'\x00',
+        b'\x08',
+        b'\x10',
+        b'\x11\x19!)19',
+        b'\x12\x1b$-6?'),
+       (b'\x0b\x0c\r\x0e\x0f',
+        b'\x03',
+        b'\x02',
+        b'\x01',
+        b'\t\x08',
+        b'\x11\x18',
+        b'\x12\x1a"*2:',
+        b'\x13\x1c%.7'),
+       (b'\x0c\r\x0e\x0f',
+        b'\x04',
+        b'\x03',
+        b'\x02',
+        b'\n\t\x08',
+        b'\x12\x19 ',
+        b'\x13\x1b#+3;',
+        b'\x14\x1d&/'),
+       (b'\r\x0e\x0f',
+        b'\x05',
+        b'\x04',
+        b'\x03',
+        b'\x0b\n\t\x08',
+        b'\x13\x1a!(',
+        b'\x14\x1c$,4<',
+        b"\x15\x1e'"),
+       (b'\x0e\x0f',
+        b'\x06',
+        b'\x05',
+        b'\x04',
+        b'\x0c\x0b\n\t\x08',
+        b'\x14\x1b")0',
+        b'\x15\x1d%-5=',
+        b'\x16\x1f'),
+       (b'\x0f',
+        b'\x07',
+        b'\x06',
+        b'\x05',
+        b'\r\x0c\x0b\n\t\x08',
+        b'\x15\x1c#*18',
+        b'\x16\x1e&.6>',
+        b'\x17'),
+       (b'\x07',
+        b'\x06',
+        b'\x0e\r\x0c\x0b\n\t\x08',
+        b'\x16\x1d$+29',
+        b"\x17\x1f'/7?"),
+       (b'\x11\x12\x13\x14\x15\x16\x17',
+        b'\t\x02',
+        b'\x08\x00',
+        b'\x18 (08',
+        b'\x19"+4='),
+       (b'\x12\x13\x14\x15\x16\x17',
+        b'\n\x03',
+        b'\t\x01',
+        b'\x08',
+        b'\x10',
+        b'\x18',
+        b'\x19!)19',
+        b'\x1a#,5>'),
+       (b'\x13\x14\x15\x16\x17',
+        b'\x0b\x04',
+        b'\n\x02',
+        b'\t\x00',
+        b'\x11\x10',
+        b'\x19 ',
+        b'\x1a"*2:',
+        b'\x1b$-6?'),
+       (b'\x14\x15\x16\x17',
+        b'\x0c\x05',
+        b'\x0b\x03',
+        b'\n\x01',
+        b'\x12\x11\x10',
+        b'\x1a!(',
+        b'\x1b#+3;',
+        b'\x1c%.7'),
+       (b'\x15\x16\x17',
+        b'\r\x06',
+        b'\x0c\x04',
+        b'\x0b\x02',
+        b'\x13\x12\x11\x10',
+        b'\x1b")0',
+        b'\x1c$,4<',
+        b'\x1d&/'),
+       (b'\x16\x17',
+        b'\x0e\x07',
+        b'\r\x05',
+        b'\x0c\x03',
+        b'\x14\x13\x12\x11\x10',
+        b'\x1c#*18',
+        b'\x1d%-5=',
+        b"\x1e'"),
+       (b'\x17',
+        b'\x0f',
+        b'\x0e\x06',
+        b'\r\x04',
+        b'\x15\x14\x13\x12\x11\x10',
+        b'\x1d$+29',
+        b'\x1e&.6>',
+        b'\x1f'),
+       (b'\x0f\x07',
+        b'\x0e\x05',
+        b'\x16\x15\x14\x13\x12\x11\x10',
+        b'\x1e%,3:',
+        b"\x1f'/7?"),
+       (b'\x19\x1a\x1b\x1c\x1d\x1e\x1f',
+        b'\x11\n\x03',
+        b'\x10\x08\x00',
+        b' (08',
+        b'!*3<'),
+       (b'\x1a\x1b\x1c\x1d\x1e\x1f',
+        b'\x12\x0b\x04',
+        b'\x11\t\x01',
+        b'\x10',
+        b'\x18',
+        b' ',
+        b'!)19',
+        b'"+4='),
+       (b'\x1b\x1c\x1d\x1e\x1f',
+        b'\x13\x0c\x05',
+        b'\x12\n\x02',
+        b'\x11\x08',
+        b'\x19\x18',
+        b'!(',
+        b'"*2:',
+        b'#,5>'),
+       (b'\x1c\x1d\x1e\x1f',
+        b'\x14\r\x06',
+        b'\x13\x0b\x03',
+        b'\x12\t\x00',
+        b'\x1a\x19\x18',
+        b'")0',
+        b'#+3;',
+        b'$-6?'),
+       (b'\x1d\x1e\x1f',
+        b'\x15\x0e\x07',
+        b'\x14\x0c\x04',
+        b'\x13\n\x01',
+        b'\x1b\x1a\x19\x18',
+        b'#*18',
+        b'$,4<',
+        b'%.7'),
+       (b'\x1e\x1f',
+        b'\x16\x0f',
+        b'\x15\r\x05',
+        b'\x14\x0b\x02',
+        b'\x1c\x1b\x1a\x19\x18',
+        b'$+29',
+        b'%-5=',
+        b'&/'),
+       (b'\x1f',
+        b'\x17',
+        b'\x16\x0e\x06',
+        b'\x15\x0c\x03',
+        b'\x1d\x1c\x1b\x1a\x19\x18',
+        b'%,3:',
+        b'&.6>',
+        b"'"),
+       (b'\x17\x0f\x07',
+        b'\x16\r\x04',
+        b'\x1e\x1d\x1c\x1b\x1a\x19\x18',
+        b'&-4;',
+        b"'/7?"),
+       (b'!"#$%&\'', b'\x19\x12\x0b\x04', b'\x18\x10\x08\x00', b'(08', b')2;'),
+       (b'"#$%&\'',
+        b'\x1a\x13\x0c\x05',
+        b'\x19\x11\t\x01',
+        b'\x18',
+        b' ',
+        b'(',
+        b')19',
+        b'*3<'),
+       (b"#$%&'",
+        b'\x1b\x14\r\x06',
+        b'\x1a\x12\n\x02',
+        b'\x19\x10',
+        b'! ',
+        b')0',
+        b'*2:',
+        b'+4='),
+       (b"$%&'",
+        b'\x1c\x15\x0e\x07',
+        b'\x1b\x13\x0b\x03',
+        b'\x1a\x11\x08',
+        b'"! ',
+        b'*18',
+        b'+3;',
+        b',5>'),
+       (b"%&'",
+        b'\x1d\x16\x0f',
+        b'\x1c\x14\x0c\x04',
+        b'\x1b\x12\t\x00',
+        b'#"! ',
+        b'+29',
+        b',4<',
+        b'-6?'),
+       (b"&'",
+        b'\x1e\x17',
+        b'\x1d\x15\r\x05',
+        b'\x1c\x13\n\x01',
+        b'$#"! ',
+        b',3:',
+        b'-5=',
+        b'.7'),
+       (b"'",
+        b'\x1f',
+        b'\x1e\x16\x0e\x06',
+        b'\x1d\x14\x0b\x02',
+        b'%$#"! ',
+        b'-4;',
+        b'.6>',
+        b'/'),
+       (b'\x1f\x17\x0f\x07', b'\x1e\x15\x0c\x03', b'&%$#"! ', b'.5<', b'/7?'),
+       (b')*+,-./', b'!\x1a\x13\x0c\x05', b' \x18\x10\x08\x00', b'08', b'1:'),
+       (b'*+,-./',
+        b'"\x1b\x14\r\x06',
+        b'!\x19\x11\t\x01',
+        b' ',
+        b'(',
+        b'0',
+        b'19',
+        b'2;'),
+       (b'+,-./',
+        b'#\x1c\x15\x0e\x07',
+        b'"\x1a\x12\n\x02',
+        b'!\x18',
+        b')(',
+        b'18',
+        b'2:',
+        b'3<'),
+       (b',-./',
+        b'$\x1d\x16\x0f',
+        b'#\x1b\x13\x0b\x03',
+        b'"\x19\x10',
+        b'*)(',
+        b'29',
+        b'3;',
+        b'4='),
+       (b'-./',
+        b'%\x1e\x17',
+        b'$\x1c\x14\x0c\x04',
+        b'#\x1a\x11\x08',
+        b'+*)(',
+        b'3:',
+        b'4<',
+        b'5>'),
+       (b'./',
+        b'&\x1f',
+        b'%\x1d\x15\r\x05',
+        b'$\x1b\x12\t\x00',
+        b',+*)(',
+        b'4;',
+        b'5=',
+        b'6?'),
+       (b'/',
+        b"'",
+        b'&\x1e\x16\x0e\x06',
+        b'%\x1c\x13\n\x01',
+        b'-,+*)(',
+        b'5<',
+        b'6>',
+        b'7'),
+       (b"'\x1f\x17\x0f\x07", b'&\x1d\x14\x0b\x02', b'.-,+*)(', b'6=', b'7?'),
+       (b'1234567', b')"\x1b\x14\r\x06', b'( \x18\x10\x08\x00', b'8', b'9'),
+       (b'234567',
+        b'*#\x1c\x15\x0e\x07',
+        b')!\x19\x11\t\x01',
+        b'(',
+        b'0',
+        b'8',
+        b'9',
+        b':'),
+       (b'34567',
+        b'+$\x1d\x16\x0f',
+        b'*"\x1a\x12\n\x02',
+        b') ',
+        b'10',
+        b'9',
+        b':',
+        b';'),
+       (b'4567',
+        b',%\x1e\x17',
+        b'+#\x1b\x13\x0b\x03',
+        b'*!\x18',
+        b'210',
+        b':',
+        b';',
+        b'<'),
+       (b'567',
+        b'-&\x1f',
+        b',$\x1c\x14\x0c\x04',
+        b'+"\x19\x10',
+        b'3210',
+        b';',
+        b'<',
+        b'='),
+       (b'67',
+        b".'",
+        b'-%\x1d\x15\r\x05',
+        b',#\x1a\x11\x08',
+        b'43210',
+        b'<',
+        b'=',
+        b'>'),
+       (b'7',
+        b'/',
+        b'.&\x1e\x16\x0e\x06',
+        b'-$\x1b\x12\t\x00',
+        b'543210',
+        b'=',
+        b'>',
+        b'?'),
+       (b"/'\x1f\x17\x0f\x07", b'.%\x1c\x13\n\x01', b'6543210', b'>', b'?'),
+       (b'9:;<=>?', b'1*#\x1c\x15\x0e\x07', b'0( \x18\x10\x08\x00'),
+       (b':;<=>?', b'2+$\x1d\x16\x0f', b'1)!\x19\x11\t\x01', b'0', b'8'),
+       (b';<=>?', b'3,%\x1e\x17', b'2*"\x1a\x12\n\x02', b'1(', b'98'),
+       (b'<=>?', b'4-&\x1f', b'3+#\x1b\x13\x0b\x03', b'2) ', b':98'),
+       (b'=>?', b"5.'", b'4,$\x1c\x14\x0c\x04', b'3*!\x18', b';:98'),
+       (b'>?', b'6/', b'5-%\x1d\x15\r\x05', b'4+"\x19\x10', b'<;:98'),
+       (b'?', b'7', b'6.&\x1e\x16\x0e\x06', b'5,#\x1a\x11\x08', b'=<;:98'),
+       (b"7/'\x1f\x17\x0f\x07", b'6-$\x1b\x12\t\x00', b'>=<;:98')),
+ 'N': ((b'\x11', b'\n'),
+       (b'\x10', b'\x12', b'\x0b'),
+       (b'\x08', b'\x11', b'\x13', b'\x0c'),
+       (b'\t', b'\x12', b'\x14', b'\r'),
+       (b'\n', b'\x13', b'\x15', b'\x0e'),
+       (b'\x0b', b'\x14', b'\x16', b'\x0f'),
+       (b'\x0c', b'\x15', b'\x17'),
+       (b'\r', b'\x16'),
+       (b'\x02', b'\x19', b'\x12'),
+       (b'\x03', b'\x18', b'\x1a', b'\x13'),
+       (b'\x04', b'\x00', b'\x10', b'\x19', b'\x1b', b'\x14'),
+       (b'\x05', b'\x01', b'\x11', b'\x1a', b'\x1c', b'\x15'),
+       (b'\x06', b'\x02', b'\x12', b'\x1b', b'\x1d', b'\x16'),
+       (b'\x07', b'\x03', b'\x13', b'\x1c', b'\x1e', b'\x17'),
+       (b'\x04', b'\x14', b'\x1d', b'\x1f'),
+       (b'\x05', b'\x15', b'\x1e'),
+       (b'\n', b'\x01', b'!', b'\x1a'),
+       (b'\x0b', b'\x02', b'\x00', b' ', b'"', b'\x1b'),
+       (b'\x0c', b'\x03', b'\x01', b'\x08', b'\x18', b'!', b'#', b'\x1c'),
+       (b'\r', b'\x04', b'\x02', b'\t', b'\x19', b'"', b'$', b'\x1d'),
+       (b'\x0e', b'\x05', b'\x03', b'\n', b'\x1a', b'#', b'%', b'\x1e'),
+       (b'\x0f', b'\x06', b'\x04', b'\x0b', b'\x1b', b'$', b'&', b'\x1f'),
+       (b'\x07', b'\x05', b'\x0c', b'\x1c', b'%', b"'"),
+       (b'\x06', b'\r', b'\x1d', b'&'),
+       (b'\x12', b'\t', b')', b'"'),
+       (b'\x13', b'\n', b'\x08', b'(', b'*', b'#'),
+       (b'\x14', b'\x0b', b'\t', b'\x10', b' ', b')', b'+', b'$'),
+       (b'\x15', b'\x0c', b'\n', b'\x11', b'!', b'*', b',', b'%'),
+       (b'\x16', b'\r', b'\x0b', b'\x12', b'"', b'+', b'-', b'&'),
+       (b'\x17', b'\x0e', b'\x0c', b'\x13', b'#', b',', b'.', b"'"),
+       (b'\x0f', b'\r', b'\x14', b'$', b'-', b'/'),
+       (b'\x0e', b'\x15', b'%', b'.'),
+       (b'\x1a', b'\x11', b'1', b'*'),
+       (b'\x1b', b'\x12', b'\x10', b'0', b'2', b'+'),
+       (b'\x1c', b'\x13', b'\x11', b'\x18', b'(', b'1', b'3', b','),
+       (b'\x1d', b'\x14', b'\x12', b'\x19', b')', b'2', b'4', b'-'),
+       (b'\x1e', b'\x15', b'\x13', b'\x1a', b'*', b'3', b'5', b'.'),
+       (b'\x1f', b'\x16', b'\x14', b'\x1b', b'+', b'4', b'6', b'/'),
+       (b'\x17', b'\x15', b'\x1c', b',', b'5', b'7'),
+       (b'\x16', b'\x1d', b'-', b'6'),
+       (b'"', b'\x19', b'9', b'2'),
+       (b'#', b'\x1a', b'\x18', b'8', b':', b'3'),
+       (b'$', b'\x1b', b'\x19', b' ', b'0', b'9', b';', b'4'),
+       (b'%', b'\x1c', b'\x1a', b'!', b'1', b':', b'<', b'5'),
+       (b'&', b'\x1d', b'\x1b', b'"', b'2', b';', b'=', b'6'),
+       (b"'", b'\x1e', b'\x1c', b'#', b'3', b'<', b'>', b'7'),
+       (b'\x1f', b'\x1d', b'$', b'4', b'=', b'?'),
+       (b'\x1e', b'%', b'5', b'>'),
+       (b'*', b'!', b':'),
+       (b'+', b'"', b' ', b';'),
+       (b',', b'#', b'!', b'(', b'8', b'<'),
+       (b'-', b'$', b'"', b')', b'9', b'='),
+       (b'.', b'%', b'#', b'*', b':', b'>'),
+       (b'/', b'&', b'$', b'+', b';', b'?'),
+       (b"'", b'%', b',', b'<'),
+       (b'&', b'-', b'='),
+       (b'2', b')'),
+       (b'3', b'*', b'('),
+       (b'4', b'+', b')', b'0'),
+       (b'5', b',', b'*', b'1'),
+       (b'6', b'-', b'+', b'2'),
+       (b'7', b'.', b',', b'3'),
+       (b'/', b'-', b'4'),
+       (b'.', b'5')),
+ 'B': ((b'\t\x12\x1b$-6?',),
+       (b'\x08', b'\n\x13\x1c%.7'),
+       (b'\t\x10', b'\x0b\x14\x1d&/'),
+       (b'\n\x11\x18', b"\x0c\x15\x1e'"),
+       (b'\x0b\x12\x19 ', b'\r\x16\x1f'),
+       (b'\x0c\x13\x1a!(', b'\x0e\x17'),
+       (b'\r\x14\x1b")0', b'\x0f'),
+       (b'\x0e\x15\x1c#*18',),
+       (b'\x01', b'\x11\x1a#,5>'),
+       (b'\x02', b'\x00', b'\x10', b'\x12\x1b$-6?'),
+       (b'\x03', b'\x01', b'\x11\x18', b'\x13\x1c%.7'),
+       (b'\x04', b'\x02', b'\x12\x19 ', b'\x14\x1d&/'),
+       (b'\x05', b'\x03', b'\x13\x1a!(', b"\x15\x1e'"),
+       (b'\x06', b'\x04', b'\x14\x1b")0', b'\x16\x1f'),
+       (b'\x07', b'\x05', b'\x15\x1c#*18', b'\x17'),
+       (b'\x06', b'\x16\x1d$+29'),
+       (b'\t\x02', b'\x19"+4='),
+       (b'\n\x03', b'\x08', b'\x18', b'\x1a#,5>'),
+       (b'\x0b\x04', b'\t\x00', b'\x19 ', b'\x1b$-6?'),
+       (b'\x0c\x05', b'\n\x01', b'\x1a!(', b'\x1c%.7'),
+       (b'\r\x06', b'\x0b\x02', b'\x1b")0', b'\x1d&/'),
+       (b'\x0e\x07', b'\x0c\x03', b'\x1c#*18', b"\x1e'"),
+       (b'\x0f', b'\r\x04', b'\x1d$+29', b'\x1f'),
+       (b'\x0e\x05', b'\x1e%,3:'),
+       (b'\x11\n\x03', b'!*3<'),
+       (b'\x12\x0b\x04', b'\x10', b' ', b'"+4='),
+       (b'\x13\x0c\x05', b'\x11\x08', b'!(', b'#,5>'),
+       (b'\x14\r\x06', b'\x12\t\x00', b'")0', b'$-6?'),
+       (b'\x15\x0e\x07', b'\x13\n\x01', b'#*18', b'%.7'),
+       (b'\x16\x0f', b'\x14\x0b\x02', b'$+29', b'&/'),
+       (b'\x17', b'\x15\x0c\x03', b'%,3:', b"'"),
+       (b'\x16\r\x04', b'&-4;'),
+       (b'\x19\x12\x0b\x04', b')2;'),
+       (b'\x1a\x13\x0c\x05', b'\x18', b'(', b'*3<'),
+       (b'\x1b\x14\r\x06', b'\x19\x10', b')0', b'+4='),
+       (b'\x1c\x15\x0e\x07', b'\x1a\x11\x08', b'*18', b',5>'),
+       (b'\x1d\x16\x0f', b'\x1b\x12\t\x00', b'+29', b'-6?'),
+       (b'\x1e\x17', b'\x1c\x13\n\x01', b',3:', b'.7'),
+       (b'\x1f', b'\x1d\x14\x0b\x02', b'-4;', b'/'),
+       (b'\x1e\x15\x0c\x03', b'.5<'),
+       (b'!\x1a\x13\x0c\x05', b'1:'),
+       (b'"\x1b\x14\r\x06', b' ', b'0', b'2;'),
+       (b'#\x1c\x15\x0e\x07', b'!\x18', b'18', b'3<'),
+       (b'$\x1d\x16\x0f', b'"\x19\x10', b'29', b'4='),
+       (b'%\x1e\x17', b'#\x1a\x11\x08', b'3:', b'5>'),
+       (b'&\x1f', b'$\x1b\x12\t\x00', b'4;', b'6?'),
+       (b"'", b'%\x1c\x13\n\x01', b'5<', b'7'),
+       (b'&\x1d\x14\x0b\x02', b'6='),
+       (b')"\x1b\x14\r\x06', b'9'),
+       (b'*#\x1c\x15\x0e\x07', b'(', b'8', b':'),
+       (b'+$\x1d\x16\x0f', b') ', b'9', b';'),
+       (b',%\x1e\x17', b'*!\x18', b':', b'<'),
+       (b'-&\x1f', b'+"\x19\x10', b';', b'='),
+       (b".'", b',#\x1a\x11\x08', b'<', b'>'),
+       (b'/', b'-$\x1b\x12\t\x00', b'=', b'?'),
+       (b'.%\x1c\x13\n\x01', b'>'),
+       (b'1*#\x1c\x15\x0e\x07',),
+       (b'2+$\x1d\x16\x0f', b'0'),
+       (b'3,%\x1e\x17', b'1('),
+       (b'4-&\x1f', b'2) '),
+       (b"5.'", b'3*!\x18'),
+       (b'6/', b'4+"\x19\x10'),
+       (b'7', b'5,#\x1a\x11\x08'),
+       (b'6-$\x1b\x12\t\x00',)),
+ 'R': ((b'\x01\x02\x03\x04\x05\x06\x07', b'\x08\x10\x18 (08'),
+       (b'\x02\x03\x04\x05\x06\x07', b'\x00', b'\t\x11\x19!)19'),
+       (b'\x03\x04\x05\x06\x07', b'\x01\x00', b'\n\x12\x1a"*2:'),
+       (b'\x04\x05\x06\x07', b'\x02\x01\x00', b'\x0b\x13\x1b#+3;'),
+       (b'\x05\x06\x07', b'\x03\x02\x01\x00', b'\x0c\x14\x1c$,4<'),
+       (b'\x06\x07', b'\x04\x03\x02\x01\x00', b'\r\x15\x1d%-5='),
+       (b'\x07', b'\x05\x04\x03\x02\x01\x00', b'\x0e\x16\x1e&.6>'),
+       (b'\x06\x05\x04\x03\x02\x01\x00', b"\x0f\x17\x1f'/7?"),
+       (b'\t\n\x0b\x0c\r\x0e\x0f', b'\x00', b'\x10\x18 (08'),
+       (b'\n\x0b\x0c\r\x0e\x0f', b'\x01', b'\x08', b'\x11\x19!)19'),
+       (b'\x0b\x0c\r\x0e\x0f', b'\x02', b'\t\x08', b'\x12\x1a"*2:'),
+       (b'\x0c\r\x0e\x0f', b'\x03', b'\n\t\x08', b'\x13\x1b#+3;'),
+       (b'\r\x0e\x0f', b'\x04', b'\x0b\n\t\x08', b'\x14\x1c$,4<'),
+       (b'\x0e\x0f', b'\x05', b'\x0c\x0b\n\t\x08', b'\x15\x1d%-5='),
+       (b'\x0f', b'\x06', b'\r\x0c\x0b\n\t\x08', b'\x16\x1e&.6>'),
+       (b'\x07', b'\x0e\r\x0c\x0b\n\t\x08', b"\x17\x1f'/7?"),
+       (b'\x11\x12\x13\x14\x15\x16\x17', b'\x08\x00', b'\x18 (08'),
+       (b'\x12\x13\x14\x15\x16\x17', b'\t\x01', b'\x10', b'\x19!)19'),
+       (b'\x13\x14\x15\x16\x17', b'\n\x02', b'\x11\x10', b'\x1a"*2:'),
+       (b'\x14\x15\x16\x17', b'\x0b\x03', b'\x12\x11\x10', b'\x1b#+3;'),
+       (b'\x15\x16\x17', b'\x0c\x04', b'\x13\x12\x11\x10', b'\x1c$,4<'),
+       (b'\x16\x17', b'\r\x05', b'\x14\x13\x12\x11\x10', b'\x1d%-5='),
+       (b'\x17', b'\x0e\x06', b'\x15\x14\x13\x12\x11\x10', b'\x1e&.6>'),
+       (b'\x0f\x07', b'\x16\x15\x14\x13\x12\x11\x10', b"\x1f'/7?"),
+       (b'\x19\x1a\x1b\x1c\x1d\x1e\x1f', b'\x10\x08\x00', b' (08'),
+       (b'\x1a\x1b\x1c\x1d\x1e\x1f', b'\x11\t\x01', b'\x18', b'!)19'),
+       (b'\x1b\x1c\x1d\x1e\x1f', b'\x12\n\x02', b'\x19\x18', b'"*2:'),
+       (b'\x1c\x1d\x1e\x1f', b'\x13\x0b\x03', b'\x1a\x19\x18', b'#+3;'),
+       (b'\x1d\x1e\x1f', b'\x14\x0c\x04', b'\x1b\x1a\x19\x18', b'$,4<'),
+       (b'\x1e\x1f', b'\x15\r\x05', b'\x1c\x1b\x1a\x19\x18', b'%-5='),
+       (b'\x1f', b'\x16\x0e\x06', b'\x1d\x1c\x1b\x1a\x19\x18', b'&.6>'),
+       (b'\x17\x0f\x07', b'\x1e\x1d\x1c\x1b\x1a\x19\x18', b"'/7?"),
+       (b'!"#$%&\'', b'\x18\x10\x08\x00', b'(08'),
+       (b'"#$%&\'', b'\x19\x11\t\x01', b' ', b')19'),
+       (b"#$%&'", b'\x1a\x12\n\x02', b'! ', b'*2:'),
+       (b"$%&'", b'\x1b\x13\x0b\x03', b'"! ', b'+3;'),
+       (b"%&'", b'\x1c\x14\x0c\x04', b'#"! ', b',4<'),
+       (b"&'", b'\x1d\x15\r\x05', b'$#"! ', b'-5='),
+       (b"'", b'\x1e\x16\x0e\x06', b'%$#"! ', b'.6>'),
+       (b'\x1f\x17\x0f\x07', b'&%$#"! ', b'/7?'),
+       (b')*+,-./', b' \x18\x10\x08\x00', b'08'),
+       (b'*+,-./', b'!\x19\x11\t\x01', b'(', b'19'),
+       (b'+,-./', b'"\x1a\x12\n\x02', b')(', b'2:'),
+       (b',-./', b'#\x1b\x13\x0b\x03', b'*)(', b'3;'),
+       (b'-./', b'$\x1c\x14\x0c\x04', b'+*)(', b'4<'),
+       (b'./', b'%\x1d\x15\r\x05', b',+*)(', b'5='),
+       (b'/', b'&\x1e\x16\x0e\x06', b'-,+*)(', b'6>'),
+       (b"'\x1f\x17\x0f\x07", b'.-,+*)(', b'7?'),
+       (b'1234567', b'( \x18\x10\x08\x00', b'8'),
+       (b'234567', b')!\x19\x11\t\x01', b'0', b'9'),
+       (b'34567', b'*"\x1a\x12\n\x02', b'10', b':'),
+       (b'4567', b'+#\x1b\x13\x0b\x03', b'210', b';'),
+       (b'567', b',$\x1c\x14\x0c\x04', b'3210', b'<'),
+       (b'67', b'-%\x1d\x15\r\x05', b'43210', b'='),
+       (b'7', b'.&\x1e\x16\x0e\x06', b'543210', b'>'),
+       (b"/'\x1f\x17\x0f\x07", b'6543210', b'?'),
+       (b'9:;<=>?', b'0( \x18\x10\x08\x00'),
+       (b':;<=>?', b'1)!\x19\x11\t\x01', b'8'),
+       (b';<=>?', b'2*"\x1a\x12\n\x02', b'98'),
+       (b'<=>?', b'3+#\x1b\x13\x0b\x03', b':98'),
+       (b'=>?', b'4,$\x1c\x14\x0c\x04', b';:98'),
+       (b'>?', b'5-%\x1d\x15\r\x05', b'<;:98'),
+       (b'?', b'6.&\x1e\x16\x0e\x06', b'=<;:98'),
+       (b"7/'\x1f\x17\x0f\x07", b'>=<;:98'))}
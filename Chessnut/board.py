@@ -4,62 +4,138 @@ Forsyth-Edwards Notation (FEN). This class is only used internally by the
 `Game` class.
 """
 
+from Chessnut.zobrist import ZOBRIST_PSQ
+
+# Piece symbols in the order of their bitboards in `Board.bb`; the white
+# pieces are listed first, followed by the black pieces in the same order.
+PIECES = 'PNBRQKpnbrqk'
+PIECE_INDEX = {sym: idx for idx, sym in enumerate(PIECES)}
+
+# The position array stores ASCII codes (empty squares hold a space); the
+# CASE_BIT is set for black (lowercase) pieces, so `code | CASE_BIT` converts
+# any piece to its lowercase symbol
+CASE_BIT = 0x20
+
+# Runs of blank squares and the digits that replace them in FEN strings
+BLANK_RUNS = [(b' ' * n, str(n).encode('ascii')) for n in range(8, 0, -1)]
+
 
 class Board(object):
     """
     This class manages the position of all pieces in a chess game. The
-    position is stored as a list of single-character strings.
+    position is stored as a bytearray of ASCII piece symbols, along with a
+    set of bitboards -- integers where bit `i` is set when the square at
+    index `i` is occupied -- for each type of piece (`bb`, ordered as in
+    `PIECES`) and for the pieces owned by each player (`occ_w`, `occ_b`, and
+    their union `occ`). The Zobrist hash of the piece placement is kept in
+    `hash` and updated incrementally as pieces are moved. The FEN string of
+    the position is only built when it is requested, and then cached until
+    the position changes.
     """
 
     def __init__(self, position=' ' * 64):
-        self._position = []
+        self._position = bytearray(b' ' * 64)
+        self.bb = [0] * 12
+        self.occ_w = 0
+        self.occ_b = 0
+        self.occ = 0
+        self.hash = 0
+        self._fen = None
         self.set_position(position)
 
     def __str__(self):
         """
         Convert the piece placement array to a FEN string.
         """
-        pos = []
-        for idx, piece in enumerate(self._position):
-
-            # add a '/' at the end of each row
-            if idx > 0 and idx % 8 == 0:
-                pos.append('/')
+        if self._fen is not None:
+            return self._fen
 
-            # blank spaces must be converted to numbers in the final FEN
-            if not piece.isspace():
-                pos.append(piece)
-            elif pos and pos[-1].isdigit():
-                pos[-1] = str(int(pos[-1]) + 1)
-            else:
-                pos.append('1')
-        return ''.join(pos)
+        # each run of blank spaces must be converted to a number in the final
+        # FEN, replacing the longest runs first
+        ranks = []
+        for idx in range(0, 64, 8):
+            rank = bytes(self._position[idx:idx + 8])
+            for blanks, count in BLANK_RUNS:
+                rank = rank.replace(blanks, count)
+            ranks.append(rank)
+        self._fen = b'/'.join(ranks).decode('ascii')
+        return self._fen
 
     def set_position(self, position):
         """
         Convert a FEN position string into a piece placement array.
         """
-        self._position = []
+        self._fen = None
+        self._position = bytearray()
         for char in position:
             if char == '/':  # skip row separator character
                 continue
             elif char.isdigit():
                 # replace numbers characters with that number of spaces
-                self._position.extend([' '] * int(char))
+                self._position.extend(b' ' * int(char))
             else:
-                self._position.append(char)
+                self._position.append(ord(char))
+
+        # rebuild the bitboards and hash from the piece placement array
+        self.bb = [0] * 12
+        self.hash = 0
+        for idx, piece in enumerate(self._position.decode('ascii')):
+            if not piece.isspace():
+                self.bb[PIECE_INDEX[piece]] |= 1 << idx
+                self.hash ^= ZOBRIST_PSQ[PIECE_INDEX[piece]][idx]
+        self.occ_w = self.bb[0] | self.bb[1] | self.bb[2] | \
+            self.bb[3] | self.bb[4] | self.bb[5]
+        self.occ_b = self.bb[6] | self.bb[7] | self.bb[8] | \
+            self.bb[9] | self.bb[10] | self.bb[11]
+        self.occ = self.occ_w | self.occ_b
+
+    @property
+    def piece_codes(self):
+        """
+        The ASCII code of the piece (or blank space) on each square, as a
+        bytearray indexed like the position array. The array is shared with
+        the board, so it must not be modified -- use set_piece() instead.
+        """
+        return self._position
 
     def get_piece(self, index):
         """Get the piece at the given index in the position array."""
-        return self._position[index]
+        return chr(self._position[index])
+
+    def set_piece(self, index, piece):
+        """
+        Place a piece (or a blank space) at the given index in the position
+        array, and update the bitboards and hash to match.
+        """
+        self._fen = None
+        bit = 1 << index
+        old = chr(self._position[index])
+        if not old.isspace():
+            self.bb[PIECE_INDEX[old]] ^= bit
+            self.hash ^= ZOBRIST_PSQ[PIECE_INDEX[old]][index]
+            if old.isupper():
+                self.occ_w ^= bit
+            else:
+                self.occ_b ^= bit
+        if not piece.isspace():
+            self.bb[PIECE_INDEX[piece]] |= bit
+            self.hash ^= ZOBRIST_PSQ[PIECE_INDEX[piece]][index]
+            if piece.isupper():
+                self.occ_w |= bit
+            else:
+                self.occ_b |= bit
+        self.occ = self.occ_w | self.occ_b
+        self._position[index] = ord(piece)
 
     def get_owner(self, index):
         """
         Get the owner of the piece at the given index in the position array.
         """
-        piece = self.get_piece(index)
-        if not piece.isspace():
-            return 'w' if piece.isupper() else 'b'
+        bit = 1 << index
+        if self.occ_w & bit:
+            return 'w'
+        elif self.occ_b & bit:
+            return 'b'
         return None
 
     def move_piece(self, start, end, piece):
@@ -68,12 +144,17 @@ class Board(object):
         to the end position. If a different piece is provided, that piece will
         be placed at the end index instead.
         """
-        self._position[end] = piece
-        self._position[start] = ' '
+        self.set_piece(end, piece)
+        self.set_piece(start, ' ')
 
     def find_piece(self, symbol):
         """
         Find the index of the specified piece on the board, returns -1 if the
-        piece is not on the board.
+        piece is not on the board. If there is more than one of the piece, the
+        lowest index is returned. Pieces are found in constant time from their
+        bitboard (which also makes locating the kings cheap).
         """
-        return ''.join(self._position).find(symbol)
+        if symbol in PIECE_INDEX:
+            bitboard = self.bb[PIECE_INDEX[symbol]]
+            return (bitboard & -bitboard).bit_length() - 1
+        return self._position.find(ord(symbol))
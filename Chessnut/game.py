@@ -12,14 +12,84 @@ handle any chess variants (e.g., Chess960) that are not equivalent to standard
 chess rules.
 """
 
-from collections import namedtuple
+from collections import Counter, namedtuple
 
-from Chessnut.board import Board
-from Chessnut.moves import MOVES
+from Chessnut.board import Board, CASE_BIT
+from Chessnut.moves import (SLIDES, RAY_MASKS, RAY_STEPS, KING_ATTACKS,
+                            KNIGHT_ATTACKS, KING_STEPS, KNIGHT_STEPS,
+                            PAWN_ATTACKS, PAWN_RAYS, ray_attacks)
+from Chessnut.zobrist import state_key
 
 # Define a named tuple with FEN field names to hold game state information
 State = namedtuple('State', ['player', 'rights', 'en_passant', 'ply', 'turn'])
 
+# Castling moves for each castling right, as (king start index, king end
+# index, bitboard of squares that must be empty between the king and rook)
+CASTLING = {'K': (60, 62, 1 << 61 | 1 << 62),
+            'Q': (60, 58, 1 << 57 | 1 << 58 | 1 << 59),
+            'k': (4, 6, 1 << 5 | 1 << 6),
+            'q': (4, 2, 1 << 1 | 1 << 2 | 1 << 3),
+            }
+CASTLE_RIGHTS = {'w': 'KQ', 'b': 'kq'}
+OPPONENT = {'w': 'b', 'b': 'w'}
+KINGS = {'w': 'K', 'b': 'k'}
+
+# The set of castling rights that *might* be voided by a move from (or to)
+# each board index
+VOID_SET = [''] * 64
+VOID_SET[0], VOID_SET[4], VOID_SET[7] = 'q', 'kq', 'k'
+VOID_SET[56], VOID_SET[60], VOID_SET[63] = 'Q', 'KQ', 'K'
+
+# The type of castling for a king move ending on each board index, and the
+# (start, end) indices of the rook that moves with the king for each type
+CASTLE_END_TO_TYPE = [None] * 64
+for _c_type, (_, _k_end, _) in CASTLING.items():
+    CASTLE_END_TO_TYPE[_k_end] = _c_type
+CASTLE_ROOK_COORDS = {'K': (63, 61), 'Q': (56, 59), 'k': (7, 5), 'q': (0, 3)}
+
+# Default list of board indices to search for moves, and the equivalent
+# bitboard with every square set
+ALL_SQUARES = tuple(range(64))
+ALL_MASK = (1 << 64) - 1
+
+# Lookup tables to convert between board indices and algebraic notation, and
+# from the start & end indices of a move to simple algebraic notation (indexed
+# by start * 64 + end)
+I2XY = tuple(chr(97 + idx % 8) + str(8 - idx // 8) for idx in ALL_SQUARES)
+XY2I = {xy: idx for idx, xy in enumerate(I2XY)}
+MOVE_STR = tuple(start + end for start in I2XY for end in I2XY)
+
+# Suffixes of pawn promotion moves, indexed by the promotion field of the
+# integer move tuples from Game._gen_moves()
+PROMOTIONS = ('', 'b', 'n', 'r', 'q')
+
+# Material value of each piece (by lowercase symbol) used to order moves in
+# Game.get_moves(); empty squares are worth nothing
+PIECE_VALUES = {'p': 1, 'n': 3, 'b': 3, 'r': 5, 'q': 9, 'k': 0, ' ': 0}
+
+
+def _format_move(move):
+    """
+    Convert an integer move tuple (start index, end index, promotion) to
+    simple algebraic notation.
+    """
+    start, end, promo = move
+    return MOVE_STR[start * 64 + end] + PROMOTIONS[promo]
+
+
+# Integer move tuples for a pawn moving from a start index to an end index
+# (keyed by start * 64 + end); pawn promotions list all possible promotions
+PAWN_MOVES = {}
+for _player in 'wb':
+    for _start in ALL_SQUARES:
+        for _end in [end for ray, _ in PAWN_RAYS[_player][_start]
+                     for end in ray]:
+            if _end < 8 or _end > 55:
+                PAWN_MOVES[_start * 64 + _end] = tuple(
+                    (_start, _end, promo) for promo in range(1, 5))
+            else:
+                PAWN_MOVES[_start * 64 + _end] = ((_start, _end, 0),)
+
 
 class InvalidMove(Exception):
     """
@@ -44,6 +114,10 @@ class Game(object):
 
     default_fen = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
 
+    # maximum number of move lists kept in the transposition table (each entry
+    # takes roughly 1 KB)
+    tt_size = 2 ** 14
+
     def __init__(self, fen=default_fen, validate=True):
         """
         Initialize the game board to the supplied FEN state (or the default
@@ -52,28 +126,61 @@ class Game(object):
         """
         self.board = Board()
         self.state = State(' ', ' ', ' ', ' ', ' ')
+        self._state_hash = 0
         self.move_history = []
         self.fen_history = []
         self.validate = validate
+        self._tt = {}
+        self._undo_stack = []
+        self._rep_hashes = Counter()
         self.set_fen(fen=fen)
 
     def __str__(self):
         """Return the current FEN representation of the game."""
-        return ' '.join(str(x) for x in [self.board] + list(self.state))
+        return self.get_fen()
+
+    def __getstate__(self):
+        """
+        Leave the transposition table out of pickled (and copied) games; it
+        is only a cache, and it can be much larger than the game itself.
+        """
+        state = self.__dict__.copy()
+        state['_tt'] = {}
+        return state
+
+    @property
+    def hash(self):
+        """
+        Return the Zobrist hash of the current position, which identifies the
+        position (including the active player, castling rights, and an en
+        passant target that can be captured) without building a FEN string.
+        """
+        return self.board.hash ^ self._state_hash
+
+    @property
+    def repetitions(self):
+        """
+        Return the number of times that the current position (including the
+        active player, castling rights, and an en passant target that can be
+        captured) has occurred in the game history, e.g., 3 for a threefold
+        repetition. Positions are counted by their hash, so this does not
+        require comparing FEN strings.
+        """
+        return self._rep_hashes[self.hash]
 
     @staticmethod
     def i2xy(pos_idx):
         """
         Convert a board index to algebraic notation.
         """
-        return chr(97 + pos_idx % 8) + str(8 - pos_idx // 8)
+        return I2XY[pos_idx]
 
     @staticmethod
     def xy2i(pos_xy):
         """
         Convert algebraic notation to board index.
         """
-        return (8 - int(pos_xy[1])) * 8 + (ord(pos_xy[0]) - ord('a'))
+        return XY2I[pos_xy]
 
     def get_fen(self):
         """
@@ -91,8 +198,11 @@ class Game(object):
         fields = fen.split(' ')
         fields[4] = int(fields[4])
         fields[5] = int(fields[5])
+        self._undo_stack = []
         self.state = State(*fields[1:])
         self.board.set_position(fields[0])
+        self._state_hash = state_key(self.state, self.board)
+        self._rep_hashes[self.hash] += 1
 
     def reset(self, fen=default_fen):
         """
@@ -101,6 +211,7 @@ class Game(object):
         """
         self.move_history = []
         self.fen_history = []
+        self._rep_hashes.clear()
         self.set_fen(fen)
 
     # def _translate(self, move):
@@ -125,237 +236,401 @@ class Game(object):
         update the game history.
         """
 
-        # declare the status fields using default parameters
-        fields = ['w', 'KQkq', '-', 0, 1]
         # move = self._translate(move)
 
-        # gracefully handle empty or incomplete moves
-        if move is None or move == '' or len(move) < 4:
+        # gracefully handle empty, incomplete, or off-board moves
+        if move is None or len(move) < 4 or len(move) > 5 or \
+                move[:2].lower() not in XY2I or \
+                move[2:4].lower() not in XY2I or \
+                move[4:].lower() not in PROMOTIONS:
             raise InvalidMove("\nIllegal move: {}\nfen: {}".format(move,
                                                                    str(self)))
 
         # convert to lower case to avoid casing issues
         move = move.lower()
-
         start = Game.xy2i(move[:2])
-        end = Game.xy2i(move[2:4])
-        piece = self.board.get_piece(start)
-        target = self.board.get_piece(end)
 
         if self.validate and move not in self.get_moves(idx_list=[start]):
             raise InvalidMove("\nIllegal move: {}\nfen: {}".format(move,
                                                                    str(self)))
 
-        # toggle the active player
-        fields[0] = {'w': 'b', 'b': 'w'}[self.state.player]
+        # record the move in the game history and apply it to the board; the
+        # board has already been updated in place (along with its hash) by
+        # _do(), so the FEN string is only built for the game history
+        self._do((start, Game.xy2i(move[2:4]), PROMOTIONS.index(move[4:])))
+        self.move_history.append(move)
+        self.fen_history.append(self.get_fen())
+        self._rep_hashes[self.hash] += 1
+
+        # moves applied to the game are never taken back, so there is no need
+        # to keep their undo information
+        del self._undo_stack[:]
+
+    def _do(self, move):
+        """
+        Apply a move given as an integer tuple (start index, end index,
+        promotion) to the board and update the state information *without*
+        validating the move or updating the game history. The information
+        needed to reverse the move is pushed onto the undo stack so that the
+        move can be taken back with _undo().
+        """
+        board, state = self.board, self.state
+        start, end, promo = move
+        piece = board.get_piece(start)
+        target = board.get_piece(end)
+        kind = piece.lower()
 
         # modify castling rights - the set of castling rights that *might*
         # be voided by a move is uniquely determined by the starting index
         # of the move - regardless of what piece moves from that position
         # (excluding chess variants like chess960).
-        rights_map = {0: 'q', 4: 'kq', 7: 'k',
-                      56: 'Q', 60: 'KQ', 63: 'K'}
-        void_set = ''.join([rights_map.get(start, ''),
-                           rights_map.get(end, '')])
-        new_rights = [r for r in self.state.rights if r not in void_set]
-        fields[1] = ''.join(new_rights) or '-'
+        rights = state.rights
+        void_set = VOID_SET[start] + VOID_SET[end]
+        if void_set:
+            rights = ''.join(r for r in rights if r not in void_set) or '-'
 
         # set en passant target square when a pawn advances two spaces
-        if piece.lower() == 'p' and abs(start - end) == 16:
-            fields[2] = Game.i2xy((start + end) // 2)
+        en_passant = '-'
+        if kind == 'p' and abs(start - end) == 16:
+            en_passant = I2XY[(start + end) // 2]
 
         # reset the half move counter when a pawn moves or is captured
-        fields[3] = self.state.ply + 1
-        if piece.lower() == 'p' or target.lower() != ' ':
-            fields[3] = 0
+        ply = 0 if kind == 'p' or target != ' ' else state.ply + 1
 
         # Increment the turn counter when the next move is from white, i.e.,
         # the current player is black
-        fields[4] = self.state.turn
-        if self.state.player == 'b':
-            fields[4] = self.state.turn + 1
+        turn = state.turn + 1 if state.player == 'b' else state.turn
 
         # check for pawn promotion
-        if len(move) == 5:
-            piece = move[4]
-            if self.state.player == 'w':
-                piece = piece.upper()
+        promo_piece = piece
+        if promo:
+            if piece.isupper():
+                promo_piece = PROMOTIONS[promo].upper()
+            else:
+                promo_piece = PROMOTIONS[promo]
 
-        # record the move in the game history and apply it to the board
-        self.move_history.append(move)
-        self.board.move_piece(start, end, piece)
+        board.move_piece(start, end, promo_piece)
 
         # move the rook to the other side of the king in case of castling
-        c_type = {62: 'K', 58: 'Q', 6: 'k', 2: 'q'}.get(end, None)
-        if piece.lower() == 'k' and c_type and c_type in self.state.rights:
-            coords = {'K': (63, 61), 'Q': (56, 59),
-                      'k': (7, 5), 'q': (0, 3)}[c_type]
-            r_piece = self.board.get_piece(coords[0])
-            self.board.move_piece(coords[0], coords[1], r_piece)
+        castle = None
+        c_type = CASTLE_END_TO_TYPE[end]
+        if kind == 'k' and c_type and c_type in state.rights:
+            castle = CASTLE_ROOK_COORDS[c_type]
+            board.move_piece(castle[0], castle[1], board.get_piece(castle[0]))
 
         # in en passant remove the piece that is captured
-        if piece.lower() == 'p' and self.state.en_passant != '-' \
-                and Game.xy2i(self.state.en_passant) == end:
-            ep_tgt = Game.xy2i(self.state.en_passant)
-            if ep_tgt < 24:
-                self.board.move_piece(end + 8, end + 8, ' ')
-            elif ep_tgt > 32:
-                self.board.move_piece(end - 8, end - 8, ' ')
+        ep_capture = None
+        if kind == 'p' and XY2I.get(state.en_passant) == end:
+            if end < 24:
+                ep_capture = (end + 8, board.get_piece(end + 8))
+            elif end > 32:
+                ep_capture = (end - 8, board.get_piece(end - 8))
+            if ep_capture:
+                board.set_piece(ep_capture[0], ' ')
+
+        self._undo_stack.append((start, end, piece, target, state,
+                                 self._state_hash, castle, ep_capture))
 
         # state update must happen after castling
-        self.set_fen(' '.join(str(x) for x in [self.board] + list(fields)))
+        self.state = State(OPPONENT[state.player], rights, en_passant, ply,
+                           turn)
+        self._state_hash = state_key(self.state, board)
+
+    def _undo(self):
+        """
+        Take back the last move applied by _do() by restoring the pieces and
+        state information saved on the undo stack.
+        """
+        (start, end, piece, target, state, state_hash,
+         castle, ep_capture) = self._undo_stack.pop()
 
-    def get_moves(self, player=None, idx_list=range(64)):
+        if ep_capture:
+            self.board.set_piece(*ep_capture)
+        if castle:
+            r_piece = self.board.get_piece(castle[1])
+            self.board.move_piece(castle[1], castle[0], r_piece)
+        self.board.set_piece(end, target)
+        self.board.set_piece(start, piece)
+
+        self.state = state
+        self._state_hash = state_hash
+
+    def _attackers(self, index, player):
+        """
+        Return a bitboard marking the pieces owned by the specified player
+        that attack the given board index. Rather than generating the player's
+        moves, the attack tables are cast outward from the index and
+        intersected with the player's piece bitboards (e.g., a knight on any
+        square a knight could reach from the index is an attacker).
+        """
+        if index < 0:
+            return 0
+
+        # offset of the player's bitboards (see Chessnut.board.PIECES)
+        bb = self.board.bb
+        i = 0 if player == 'w' else 6
+        opp = OPPONENT[player]
+
+        attackers = (KNIGHT_ATTACKS[index] & bb[i + 1] |
+                     PAWN_ATTACKS[opp][index] & bb[i] |
+                     KING_ATTACKS[index] & bb[i + 5])
+
+        # sliding pieces attack along a ray up to the first blocking piece;
+        # rays that hold none of the player's sliders are skipped without
+        # looking for the blocker
+        occ = self.board.occ
+        for sym, sliders in [('r', bb[i + 3] | bb[i + 4]),
+                             ('b', bb[i + 2] | bb[i + 4])]:
+            if sliders:
+                for d in SLIDES[sym]:
+                    if RAY_MASKS[d][index] & sliders:
+                        attackers |= ray_attacks(index, d, occ) & sliders
+
+        return attackers
+
+    def get_moves(self, player=None, idx_list=ALL_SQUARES, ordered=False):
         """
         Get a list containing the legal moves for pieces owned by the
         specified player that are located at positions included in the
         idx_list. By default, it compiles the list for the active player
         (i.e., self.state.player) by filtering the list of _all_moves() to
         eliminate any that would expose the player's king to check.
-        """
-        if not self.validate:
-            return self._all_moves(player=player, idx_list=idx_list)
 
+        If ordered is True, the moves are sorted so that the most promising
+        moves come first: all captures (including en passant), ranked by the
+        value of the captured piece less the value of the moving piece
+        (MVV-LVA) plus the value of any promoted piece, then quiet promotions
+        ranked by the value of the promoted piece, then the remaining quiet
+        moves. Alpha-beta searches should consume the moves in the returned
+        order to prune the most branches.
+        """
         if not player:
             player = self.state.player
 
-        res_moves = []
+        moves = self._all_moves(player=player, idx_list=idx_list)
+        if self.validate:
+            moves = self._legal_moves(player, moves)
+        if ordered:
+            moves = sorted(moves, key=self._mvv_lva_key)
 
-        # This is the most inefficient part of the model - there is no cache
-        # for previously computed move lists, so creating a new test board
-        # each time and applying the moves incurs high overhead, and throws
-        # away the result at the end of each pass through the loop
-        test_board = Game(fen=str(self), validate=False)
-        for move in self._all_moves(player=player, idx_list=idx_list):
+        return [_format_move(move) for move in moves]
 
-            test_board.reset(fen=str(self))
+    def _mvv_lva_key(self, move):
+        """
+        Sort key for an integer move tuple that places captures of the most
+        valuable victims by the least valuable attackers first, followed by
+        quiet promotions to the most valuable pieces and then quiet moves.
+        """
+        position = self.board.piece_codes
+        start, end, promo = move
+        attacker = chr(position[start] | CASE_BIT)
+        victim = PIECE_VALUES[chr(position[end] | CASE_BIT)]
+        if attacker == 'p' and end == XY2I.get(self.state.en_passant):
+            victim = PIECE_VALUES['p']  # en passant captures a pawn
+        score = PIECE_VALUES[PROMOTIONS[promo] or ' ']
+        if victim:
+            # every capture scores above every quiet promotion
+            score += 100 + victim * 10 - PIECE_VALUES[attacker]
+        return -score
+
+    def _legal_moves(self, player, moves):
+        """
+        Filter a list of integer move tuples from _all_moves() to eliminate
+        any that would expose the player's king to check.
+        """
+        res_moves = []
+        k_sym, opp = KINGS[player], OPPONENT[player]
+        kdx = self.board.find_piece(k_sym)
+
+        # A move can only expose the king if the king is already in check,
+        # the king itself moves, or the moving piece is on a line from the
+        # king (and so might be pinned) -- en passant captures are always
+        # tested because they remove a second piece from the board
+        checkers = self._attackers(kdx, opp)
+        ep_idx = XY2I.get(self.state.en_passant, -1)
+        lines = 0
+        king_ends = 0  # bitboard of the squares the king can safely move to
+        if kdx >= 0:
+            for d in range(8):
+                lines |= RAY_MASKS[d][kdx]
+
+        for move in moves:
+
+            start, end, _ = move
+            if not (checkers or start == kdx or lines >> start & 1 or
+                    end == ep_idx):
+                res_moves.append(move)
+                continue
 
             # Don't allow castling out of or through the king in check
-            k_sym, opp = {'w': ('K', 'b'), 'b': ('k', 'w')}.get(player)
-            kdx = self.board.find_piece(k_sym)
-            k_loc = Game.i2xy(kdx)
-            dx = abs(kdx - Game.xy2i(move[2:4]))
-
-            if move[0:2] == k_loc and dx == 2:
-
-                op_moves = set([m[2:4] for m in test_board.get_moves(player=opp)])
-                castle_gap = {'e1g1': 'e1f1', 'e1c1': 'e1d1',
-                              'e8g8': 'e8f8', 'e8c8': 'e8d8'}.get(move, '')
-
-                # testing for castle gap in the move list depends on _all_moves()
-                # returning moves in order radiating away from each piece, so that
-                # king castling moves are always considered after verifying the king
-                # can legally move to the gap cell.
-                if (k_loc in op_moves or castle_gap and castle_gap not in res_moves):
+            if start == kdx and abs(kdx - end) == 2:
+
+                # testing for the castle gap in the set of safe king moves
+                # depends on _all_moves() listing castling after the king's
+                # move to the gap cell, so that castling moves are always
+                # considered after verifying the king can legally move there.
+                if checkers or not king_ends >> (start + end) // 2 & 1:
                     continue
 
-            # Apply the move to the test board to ensure that the king does
-            # not end up in check
-            test_board.apply_move(move)
-            tgts = set([m[2:4] for m in test_board.get_moves()])
+            # Apply the move to the board to ensure that the king does not
+            # end up in check, then take it back
+            self._do(move)
+            is_safe = not self._attackers(self.board.find_piece(k_sym), opp)
+            self._undo()
 
-            if Game.i2xy(test_board.board.find_piece(k_sym)) not in tgts:
+            if is_safe:
                 res_moves.append(move)
+                if start == kdx:
+                    king_ends |= 1 << end
 
         return res_moves
 
-    def _all_moves(self, player=None, idx_list=range(64)):
+    def _all_moves(self, player=None, idx_list=ALL_SQUARES):
         """
-        Get a list containing all reachable moves for pieces owned by the
+        Get a tuple containing all reachable moves for pieces owned by the
         specified player (including moves that would expose the player's king
         to check) that are located at positions included in the idx_list. By
         default, it compiles the list for the active player (i.e.,
-        self.state.player) by checking every square on the board.
+        self.state.player) by checking every square on the board. Moves are
+        integer tuples (start index, end index, promotion); they are only
+        converted to simple algebraic notation by get_moves().
+
+        Full-board move lists are memoized in a transposition table keyed by
+        the Zobrist hash of the position and the player, so repeated queries
+        for the same position are answered without generating the moves
+        again. Queries for a subset of the squares (e.g., validating a move
+        in apply_move()) filter the cached full-board list when there is one
+        and are never stored themselves. The table is bounded by `tt_size`,
+        evicting the oldest entries first.
         """
         player = player or self.state.player
-        res_moves = []
-        for start in idx_list:
-            if self.board.get_owner(start) != player:
-                continue
-
-            # MOVES contains the list of all possible moves for a piece of
-            # the specified type on an empty chess board.
-            piece = self.board.get_piece(start)
-            rays = MOVES.get(piece, [''] * 64)
-
-            for ray in rays[start]:
-                # Trace each of the 8 (or fewer) possible directions that a
-                # piece at the given starting index could move
-
-                new_moves = self._trace_ray(start, piece, ray, player)
-                res_moves.extend(new_moves)
-
-        return res_moves
-
-    def _trace_ray(self, start, piece, ray, player):
+        key = (self.hash, player)
+        moves = self._tt.get(key)
+
+        if idx_list is not ALL_SQUARES:
+            squares = 0
+            for idx in idx_list:
+                squares |= 1 << idx
+            if moves is None:
+                return tuple(self._gen_moves(player, squares))
+            return tuple(m for m in moves if squares >> m[0] & 1)
+
+        if moves is None:
+            moves = tuple(self._gen_moves(player, ALL_MASK))
+            if len(self._tt) >= self.tt_size:
+                del self._tt[next(iter(self._tt))]
+            self._tt[key] = moves
+        return moves
+
+    def _gen_moves(self, player, squares):
         """
-        Return a list of moves by filtering the supplied ray (a list of
-        indices corresponding to end points that lie on a common line from
-        the starting index) based on the state of the chess board (e.g.,
-        castling, capturing, en passant, etc.). Moves are in simple algebraic
-        notation, e.g., 'a2a4', 'g7h8q', etc.
-
-        Each ray should be an element from Chessnut.MOVES, representing all
-        the moves that a piece could make from the starting square on an
-        otherwise blank chessboard. This function filters the moves in a ray
-        by enforcing the rules of chess for the legality of capturing pieces,
-        castling, en passant, and pawn promotion.
+        Generate the list of reachable moves for _all_moves() without using
+        the transposition table, for the pieces at the board indices marked
+        in the squares bitboard. Only the player's own pieces are visited
+        (in order of increasing index), rather than every square.
+
+        Moves are found by intersecting the precomputed attack tables in
+        Chessnut.moves with the occupancy bitboards of the board. This is the
+        innermost loop of the model, so it works only with integers -- each
+        move is a tuple (start index, end index, promotion) where promotion
+        indexes PROMOTIONS -- and the tables it uses are bound to local
+        variables to avoid repeated attribute and global lookups.
         """
-        res_moves = []
-
-        for end in ray:
+        board = self.board
+        position = board.piece_codes
+        if player == 'w':
+            own, opp = board.occ_w, board.occ_b
+        else:
+            own, opp = board.occ_b, board.occ_w
+        occ = own | opp
+        free = ~own
+
+        ep_coords = self.state.en_passant
+        if ep_coords != '-':
+            opp |= 1 << Game.xy2i(ep_coords)
+
+        pawn_rays = PAWN_RAYS[player]
+        pawn_moves = PAWN_MOVES
+        knight_steps = KNIGHT_STEPS
+        king_steps = KING_STEPS
+        ray_masks = RAY_MASKS
+        ray_steps = RAY_STEPS
+        castling = [CASTLING[r] for r in CASTLE_RIGHTS[player]
+                    if r in self.state.rights]
 
-            sym = piece.lower()
-            del_x = abs(end - start) % 8
-            move = [Game.i2xy(start) + Game.i2xy(end)]
-            tgt_owner = self.board.get_owner(end)
-
-            # Abort if the current player owns the piece at the end point
-            if tgt_owner == player:
-                break
-
-            # Test castling exception for king
-            if sym == 'k' and del_x == 2:
-                gap_owner = self.board.get_owner((start + end) // 2)
-                out_owner = self.board.get_owner(end - 1)
-                rights = {62: 'K', 58: 'Q', 6: 'k', 2: 'q'}.get(end, ' ')
-                if (tgt_owner or gap_owner or rights not in self.state.rights or
-                        (rights.lower() == 'q' and out_owner)):
-                    # Abort castling because missing castling rights
-                    # or piece in the way
-                    break
+        res_moves = []
+        append = res_moves.append
+        extend = res_moves.extend
+        pieces = own & squares
+        while pieces:
+            lsb = pieces & -pieces
+            pieces ^= lsb
+            start = lsb.bit_length() - 1
+            sym = chr(position[start] | CASE_BIT)
 
             if sym == 'p':
-                # Pawns cannot move forward to a non-empty square
-                if del_x == 0 and tgt_owner:
-                    break
-
-                # Test en passant exception for pawn
-                elif del_x != 0 and not tgt_owner:
-                    ep_coords = self.state.en_passant
-                    if ep_coords == '-' or end != Game.xy2i(ep_coords):
-                        break
-
-                # Pawn promotions should list all possible promotions
-                if (end < 8 or end > 55):
-                    move = [move[0] + s for s in ['b', 'n', 'r', 'q']]
-
-            res_moves.extend(move)
-
-            # break after capturing an enemy piece
-            if tgt_owner:
-                break
+                # Pawns capture diagonally and cannot move forward to (or
+                # through) a non-empty square
+                for ray, capture in pawn_rays[start]:
+                    if capture:
+                        if opp >> ray[0] & 1:
+                            extend(pawn_moves[start * 64 + ray[0]])
+                        continue
+                    for end in ray:
+                        if occ >> end & 1:
+                            break
+                        extend(pawn_moves[start * 64 + end])
+
+            elif sym == 'n' or sym == 'k':
+                # Single steps are listed in the order of the directions
+                # rather than the order of the end indices. Castling moves
+                # are listed directly after the king's step to the gap square
+                # so that the move through the gap square is always
+                # considered first; castling requires the corresponding
+                # castling rights and an empty path between the king and rook
+                steps = knight_steps if sym == 'n' else king_steps
+                for end in steps[start]:
+                    if free >> end & 1:
+                        append((start, end, 0))
+                        if sym == 'k':
+                            for k_start, k_end, path in castling:
+                                if k_start == start and \
+                                        (k_start + k_end) // 2 == end and \
+                                        not occ & path:
+                                    append((start, k_end, 0))
+
+            else:
+                # Sliding pieces list their moves ray by ray, radiating away
+                # from the starting index until the first blocking piece
+                for d in SLIDES[sym]:
+                    ray = ray_masks[d][start]
+                    blockers = ray & occ
+                    if ray_steps[d] > 0:
+                        if blockers:
+                            blocker = (blockers & -blockers).bit_length() - 1
+                            ray ^= ray_masks[d][blocker]
+                        ray &= free
+                        while ray:
+                            lsb = ray & -ray
+                            ray ^= lsb
+                            append((start, lsb.bit_length() - 1, 0))
+                    else:
+                        if blockers:
+                            ray ^= ray_masks[d][blockers.bit_length() - 1]
+                        ray &= free
+                        while ray:
+                            end = ray.bit_length() - 1
+                            ray ^= 1 << end
+                            append((start, end, 0))
 
         return res_moves
 
     @property
     def status(self):
 
-        k_sym, opp = {'w': ('K', 'b'), 'b': ('k', 'w')}.get(self.state.player)
-        k_loc = Game.i2xy(self.board.find_piece(k_sym))
+        k_sym, opp = KINGS[self.state.player], OPPONENT[self.state.player]
         can_move = len(self.get_moves())
-        is_exposed = [m[2:4] for m in self._all_moves(player=opp)
-                      if m[2:4] == k_loc]
+        is_exposed = self._attackers(self.board.find_piece(k_sym), opp)
 
         status = Game.NORMAL
         if is_exposed:
@@ -5,15 +5,16 @@ legal moves on a chessboard.
 The structure returned is a dictionary using single-character symbols for keys
 (representing each type of chess piece, e.g., 'k', 'Q', 'N', 'r', etc. -- with
 lowercase letters for black pieces and uppercase for white), and whose values
-are 64-element lists.
+are 64-element tuples.
 
 The list indices correspond to a raster-style index of a chessboard (i.e.,
 'a8'=0, 'h8'=8, 'a7'=8,...'h1'=63) representing the starting square of the
-piece. Each element of the list is another list that contains 8 or fewer
+piece. Each element of the tuple is another tuple that contains 8 or fewer
 elements that represent vectors for the 8 possible directions ("rays") that a
-chesspiece could move. Each vector is a list containing integers that
-represent the ending index of a legal move, sorted by increasing distance
-from the starting point. Empty vectors are removed from the list.
+chesspiece could move. Each vector is a bytes object (i.e., an immutable
+sequence of small integers, one byte each) whose items represent the ending
+index of a legal move, sorted by increasing distance from the starting
+point. Empty vectors are removed from the tuple.
 
 For example: A queen on 'h8' (idx = 7) can move to the left (West) to each
 of the indices 0, 1, 2, 3, 4, 5, 6, and cannot move right (East), right/up
@@ -24,13 +25,13 @@ len(MOVES['q'][7]) == 3  # West, Southwest, & South
 
  - and -
 
-MOVES['q'][7][0] = [6, 5, 4, 3, 2, 1, 0]  # sorted by distance from idx = 7
+list(MOVES['q'][7][0]) == [6, 5, 4, 3, 2, 1, 0]  # sorted by distance
 
 Which says that a black queen at 'h8' can move in a line to 'g8', 'f8',...'a8'.
 
 Generalizing:
 
-MOVES[<piece>][<starting index>][<direction>] = [list of moves]
+MOVES[<piece>][<starting index>][<direction>] = (bytes of move indices)
 
 This list of moves assumes that there are no other pieces on the board, so the
 actual set of legal moves for a particular board will be a subset of those
@@ -41,91 +42,260 @@ It isn't a significant computational savings, but it simplifies the logic for
 determining legal moves.
 """
 
-from math import atan2
-from copy import deepcopy
+from functools import lru_cache
+from types import MappingProxyType
 
-
-# Precalculate angles for index pairs that form legal moves - straight lines
+# Vectors (dx, dy) for the directions that pieces move - straight lines
 # (up, down, left, right, diagonal) and the 8 directions a knight can move;
-# the index of the angle within this list will be used as the ray index to
-# group moves that lie in the same direction.
+# the index of the direction within this list (mod 8) is used as the ray
+# index to group moves that lie in the same direction.
 DIRECTIONS = [(1, 0), (1, 1), (0, 1), (-1, 1),  # straight lines
               (-1, 0), (-1, -1), (0, -1), (1, -1),
               (2, 1), (1, 2), (-1, 2), (-2, 1),  # knights
               (-2, -1), (-1, -2), (1, -2), (2, -1),
               ]
-RAYS = [atan2(d[1], d[0]) for d in DIRECTIONS]
-
-
-# These keys are chess piece names, and the values are functions that verify
-# legality of moving in a particular direction for that type of piece. Symbols
-# for the white piece ('K', 'Q', 'N', 'B', and 'R') do not need to be
-# explicitly tested because their moves are the same as the black pieces for
-# all pieces *except* pawns, which differ because they are the only pieces
-# that cannot move backwards.
-PIECES = {'k': lambda y, dx, dy: abs(dx) <= 1 and abs(dy) <= 1,
-          'q': lambda y, dx, dy: dx == 0 or dy == 0 or abs(dx) == abs(dy),
-          'n': lambda y, dx, dy: (abs(dx) >= 1 and
-                                  abs(dy) >= 1 and
-                                  abs(dx) + abs(dy) == 3),
-          'b': lambda y, dx, dy: abs(dx) == abs(dy),
-          'r': lambda y, dx, dy: dx == 0 or dy == 0,
-          'p': lambda y, dx, dy: (y < 8 and abs(dx) <= 1 and dy == -1),
-          'P': lambda y, dx, dy: (y > 1 and abs(dx) <= 1 and dy == 1),
+
+
+# These keys are chess piece names, and the values are the directions (indices
+# into DIRECTIONS) that each type of piece can move, and whether the piece
+# slides along the direction to the edge of the board or takes only a single
+# step. Symbols for the white pieces ('K', 'Q', 'N', 'B', and 'R') are not
+# listed because their moves are the same as the black pieces for all pieces
+# *except* pawns, which differ because they are the only pieces that cannot
+# move backwards.
+PIECES = {'k': (tuple(range(8)), False),
+          'q': (tuple(range(8)), True),
+          'n': (tuple(range(8, 16)), False),
+          'b': ((1, 3, 5, 7), True),
+          'r': ((0, 2, 4, 6), True),
+          'p': ((5, 6, 7), False),
+          'P': ((1, 2, 3), False),
           }
 
-MOVES = dict()
 
-for sym, is_legal in PIECES.items():
+def _step(idx, dx, dy):
+    """
+    Return the index one step from idx in the direction (dx, dy), or None if
+    the step would leave the board.
+    """
+    x, y = idx % 8 + dx, idx // 8 - dy
+    if 0 <= x < 8 and 0 <= y < 8:
+        return y * 8 + x
+    return None
+
+
+def _ray(idx, dx, dy):
+    """
+    Return the list of indices reached by repeatedly stepping from idx in the
+    direction (dx, dy), sorted by increasing distance from idx.
+    """
+    ray = []
+    end = _step(idx, dx, dy)
+    while end is not None:
+        ray.append(end)
+        end = _step(end, dx, dy)
+    return ray
+
+
+# Bitboard attack tables. Each entry is an integer whose set bits mark the
+# squares that a piece on the given index could reach on an otherwise empty
+# board, using the same raster indexing as MOVES (i.e., bit 0 = 'a8', bit 63 =
+# 'h1'). The board model intersects these masks with its occupancy bitboards
+# to find the moves that are possible in the current position.
+def _mask(indices):
+    """Convert an iterable of board indices to a bitboard."""
+    res = 0
+    for idx in indices:
+        if idx is not None:
+            res |= 1 << idx
+    return res
+
+
+# RAY_MASKS[d][idx] is the bitboard of all squares in the straight line
+# direction DIRECTIONS[d] from idx. Moving along a ray changes the index by
+# RAY_STEPS[d], so the nearest square on a ray with a positive step is the
+# least significant set bit, and the nearest square on a ray with a negative
+# step is the most significant set bit.
+RAY_MASKS = [[_mask(_ray(idx, *DIRECTIONS[d])) for idx in range(64)]
+             for d in range(8)]
+RAY_STEPS = [dx - 8 * dy for dx, dy in DIRECTIONS[:8]]
+
+# STEP_MASKS[d][idx] is the bitboard of the single square one step from idx in
+# direction DIRECTIONS[d] (or 0 if the step leaves the board), i.e., the move
+# a king or knight makes in that direction
+STEP_MASKS = [[_mask([_step(idx, *DIRECTIONS[d])]) for idx in range(64)]
+              for d in range(16)]
+
+# The directions (indices into RAY_MASKS) that each sliding piece can move
+SLIDES = {'b': (1, 3, 5, 7), 'r': (0, 2, 4, 6), 'q': tuple(range(8))}
+
+KING_ATTACKS = [sum(STEP_MASKS[d][idx] for d in range(8))
+                for idx in range(64)]
+KNIGHT_ATTACKS = [sum(STEP_MASKS[d][idx] for d in range(8, 16))
+                  for idx in range(64)]
+
+# The end indices of the single steps a king or knight can take from each
+# index, listed in the order of DIRECTIONS so that these moves are generated
+# in the same order as the rays in MOVES
+KING_STEPS = [tuple(end for end in (_step(idx, *d) for d in DIRECTIONS[:8])
+                    if end is not None) for idx in range(64)]
+KNIGHT_STEPS = [tuple(end for end in (_step(idx, *d) for d in DIRECTIONS[8:])
+                      if end is not None) for idx in range(64)]
+
+# Pawns capture diagonally towards the opposing side of the board
+PAWN_ATTACKS = {'w': [_mask([_step(idx, 1, 1), _step(idx, -1, 1)])
+                      for idx in range(64)],
+                'b': [_mask([_step(idx, 1, -1), _step(idx, -1, -1)])
+                      for idx in range(64)],
+                }
+
+
+def ray_attacks(idx, d, occupied):
+    """
+    Return the bitboard of squares attacked by a sliding piece at idx in the
+    direction d (an index into RAY_MASKS) given the bitboard of occupied
+    squares. The ray stops at (and includes) the first occupied square.
+    """
+    ray = RAY_MASKS[d][idx]
+    blockers = ray & occupied
+    if blockers:
+        if RAY_STEPS[d] > 0:
+            blocker = (blockers & -blockers).bit_length() - 1
+        else:
+            blocker = blockers.bit_length() - 1
+        ray ^= RAY_MASKS[d][blocker]
+    return ray
+
+
+def bishop_attacks(idx, occupied=0):
+    """
+    Return the bitboard of squares attacked by a bishop at idx given the
+    bitboard of occupied squares (i.e., the union of its diagonal rays from
+    ray_attacks()).
+    """
+    return (ray_attacks(idx, 1, occupied) | ray_attacks(idx, 3, occupied) |
+            ray_attacks(idx, 5, occupied) | ray_attacks(idx, 7, occupied))
+
+
+def rook_attacks(idx, occupied=0):
+    """
+    Return the bitboard of squares attacked by a rook at idx given the
+    bitboard of occupied squares (i.e., the union of its orthogonal rays from
+    ray_attacks()).
+    """
+    return (ray_attacks(idx, 0, occupied) | ray_attacks(idx, 2, occupied) |
+            ray_attacks(idx, 4, occupied) | ray_attacks(idx, 6, occupied))
+
+
+def queen_attacks(idx, occupied=0):
+    """
+    Return the bitboard of squares attacked by a queen at idx given the
+    bitboard of occupied squares.
+    """
+    return bishop_attacks(idx, occupied) | rook_attacks(idx, occupied)
+
+
+def _decode(bitboard, reverse=False):
+    """
+    Return the list of indices of the set bits in a bitboard in increasing
+    order, or in decreasing order if reverse is True.
+    """
+    indices = []
+    while bitboard:
+        if reverse:
+            idx = bitboard.bit_length() - 1
+        else:
+            idx = (bitboard & -bitboard).bit_length() - 1
+        bitboard ^= 1 << idx
+        indices.append(idx)
+    return indices
 
-    MOVES[sym] = list()
 
-    for idx in range(64):
+@lru_cache(maxsize=64)
+def gen(idx):
+    """
+    Return a dictionary containing the rays for each type of piece starting
+    from idx, i.e., MOVES[<piece>][idx] for every piece. Rays are decoded
+    from the bitboards of the squares each piece can reach in every
+    direction, visiting the bits nearest to idx first so that the rays are
+    sorted by distance from idx.
 
-        # Initialize arrays for each of the 8 possible directions that a
-        # piece could be moved; some of these will be empty and
-        # removed later
-        MOVES[sym].append([list() for _ in range(8)])
+    Results are memoized, so the dictionary is returned as a read-only view
+    to keep callers from modifying the cached rays.
+    """
+    moves = {}
+    for sym, piece in PIECES.items():
+        directions, slides = piece
+        rays = [list() for _ in range(8)]
+        for d in directions:
+            mask = RAY_MASKS[d][idx] if slides else STEP_MASKS[d][idx]
+            dx, dy = DIRECTIONS[d]
+            rays[d % 8] = _decode(mask, reverse=dx - 8 * dy < 0)
 
-        # Sorting the list of end points by distance from the starting
-        # point ensures that the ouptut order is properly sorted
-        for end in sorted(range(64), key=lambda x: abs(x - idx)):
+        # Pawns cannot move from their own back rank, and can advance two
+        # spaces from their starting rank
+        if sym == 'p':
+            if idx < 8:
+                rays = []
+            elif idx < 16:
+                rays[6].append(idx + 16)
+        elif sym == 'P':
+            if idx > 55:
+                rays = []
+            elif idx > 47:
+                rays[2].append(idx - 16)
 
-            # Determine the row, change in column, and change in row
-            # of the start/end point pair for move validation
-            y = 8 - idx // 8
-            dx = (end % 8) - (idx % 8)
-            dy = (8 - end // 8) - y
+        moves[sym] = tuple(bytes(r) for r in rays if r)
 
-            if idx == end or not is_legal(y, dx, dy):
-                continue
+    # White pieces share the rays of the black pieces, except for castling,
+    # which is added directly to the East & West rays of the kings
+    for sym in ['K', 'Q', 'N', 'B', 'R']:
+        moves[sym] = moves[sym.lower()]
+    for sym, start in [('k', 4), ('K', 60)]:
+        if idx == start:
+            moves[sym] = tuple(r + bytes([2 * r[0] - idx])
+                               if abs(r[0] - idx) == 1
+                               else r for r in moves[sym])
 
-            angle = atan2(dy, dx)
-            if angle in RAYS:
+    return MappingProxyType(moves)
 
-                # Mod by 8 to shift the ray index of knight moves down
-                # by 8 from the index found in DIRECTIONS; the ray index of
-                # all other pieces will be unchanged
-                ray_num = RAYS.index(angle) % 8
-                MOVES[sym][idx][ray_num].append(end)
 
-        # Remove unused (empty) lists
-        MOVES[sym][idx] = [r for r in MOVES[sym][idx] if r]
+# MOVES is loaded from a table generated ahead of time by calling gen() for
+# every square (see tools/gen_moves_table.py), so the rays are not rebuilt
+# each time the package is imported; gen() is only used at runtime when the
+# table has not been generated.
+try:
+    from Chessnut._moves_table import MOVES
+except ImportError:
+    _SQUARES = [gen(idx) for idx in range(64)]
+    MOVES = {sym: tuple(moves[sym] for moves in _SQUARES)
+             for sym in _SQUARES[0]}
 
-# Create references to remaining pieces - the original set is only
-# minimally covering; Pawns are already included.
-for sym in ['K', 'Q', 'N', 'B', 'R']:
-    MOVES[sym] = deepcopy(MOVES[sym.lower()])
+# PAWN_RAYS[<player>][<starting index>] pairs each of the pawn's rays in MOVES
+# with whether the ray is a (diagonal) capture or a forward advance; advances
+# list the double-space opening move after the single-space move so that it
+# is only considered when the single-space move is unobstructed
+PAWN_RAYS = {player: [tuple((ray, ray[0] % 8 != idx % 8)
+                            for ray in MOVES[sym][idx]) for idx in range(64)]
+             for player, sym in [('w', 'P'), ('b', 'p')]}
 
-# Directly add castling for kings
-MOVES['k'][4][0].append(6)
-MOVES['k'][4][1].append(2)
-MOVES['K'][60][0].append(62)
-MOVES['K'][60][4].append(58)
+# MOVE_COUNTS[<piece>][<starting index>] is the total number of moves in the
+# rays of MOVES[<piece>][<starting index>]
+MOVE_COUNTS = {sym: tuple(sum(map(len, rays)) for rays in MOVES[sym])
+               for sym in MOVES}
 
-# Directly add double-space pawn opening moves
-IDX = 0
-for i in range(8):
-    MOVES['p'][8 + i][IDX].append(24 + i)
-    MOVES['P'][55 - i][IDX].append(39 - i)
-    IDX = 1
+# Every square is either a corner of the board, on one of the edges of the
+# board, or in the center of the board; pieces have the same number of moves
+# (or a narrow range of moves) from every square in each class, so
+# MOVES_BY_CLASS[<class>][<piece>] maps the indices of the squares in the
+# class to their rays in MOVES
+SQUARE_CLASSES = {'corner': (0, 7, 56, 63),
+                  'edge': tuple(idx for idx in range(64)
+                                if (idx % 8 in (0, 7)) !=
+                                (idx // 8 in (0, 7))),
+                  'center': tuple(r * 8 + c for r in range(1, 7)
+                                  for c in range(1, 7)),
+                  }
+MOVES_BY_CLASS = {cls: {sym: {idx: MOVES[sym][idx] for idx in squares}
+                        for sym in MOVES}
+                  for cls, squares in SQUARE_CLASSES.items()}
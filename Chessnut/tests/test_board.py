@@ -1,5 +1,5 @@
 
-from Chessnut.board import Board
+from Chessnut.board import Board, PIECE_INDEX
 import unittest
 
 
@@ -14,6 +14,12 @@ class BoardTest(unittest.TestCase):
         self.assertEqual(self.board.get_piece(0), 'r')
         self.assertEqual(self.board.get_piece(1), ' ')
 
+    def test_piece_codes(self):
+        self.board.set_position('r7/8/8/8/8/8/8/7R')
+        self.assertEqual(self.board.piece_codes[0], ord('r'))
+        self.assertEqual(self.board.piece_codes[63], ord('R'))
+        self.assertEqual(self.board.piece_codes[1], ord(' '))
+
     def test_get_owner(self):
         self.board.set_position('r7/8/8/8/8/8/8/7R')
         self.assertEqual(self.board.get_owner(0), 'b')
@@ -22,6 +28,25 @@ class BoardTest(unittest.TestCase):
 
     def test_move_piece(self):
         self.board.set_position('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR')
+        self.assertEqual(str(self.board),
+                         'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR')
         self.board.move_piece(52, 36, 'P')  # e2e4
         self.assertEqual(str(self.board),
                          'rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR')
+
+    def test_bitboards(self):
+        self.board.set_position('r7/8/8/8/8/8/8/7R')
+        self.assertEqual(self.board.bb[PIECE_INDEX['r']], 1)
+        self.assertEqual(self.board.occ_w, 1 << 63)
+        self.board.move_piece(63, 0, 'R')  # h1xa8
+        self.assertEqual(self.board.bb[PIECE_INDEX['r']], 0)
+        self.assertEqual(self.board.bb[PIECE_INDEX['R']], 1)
+        self.assertEqual(self.board.occ_b, 0)
+        self.assertEqual(self.board.occ, 1)
+
+    def test_find_piece(self):
+        self.assertEqual(self.board.find_piece('k'), 4)
+        self.assertEqual(self.board.find_piece('K'), 60)
+        self.assertEqual(self.board.find_piece('P'), 48)
+        self.board.set_position('8/8/8/8/8/8/8/7R')
+        self.assertEqual(self.board.find_piece('K'), -1)
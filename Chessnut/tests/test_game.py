@@ -1,5 +1,10 @@
 
+import pickle
+import sys
 import unittest
+from collections import deque
+from functools import lru_cache
+
 from Chessnut.game import Game, InvalidMove
 
 
@@ -7,32 +12,90 @@ from Chessnut.game import Game, InvalidMove
 START_POS = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
 
 # Opening moves for white in sorted() order
-LEGAL_OPENINGS = ['a2a3', 'a2a4', 'b1a3', 'b1c3', 'b2b3', 'b2b4', 'c2c3',
+LEGAL_OPENINGS = ('a2a3', 'a2a4', 'b1a3', 'b1c3', 'b2b3', 'b2b4', 'c2c3',
                   'c2c4', 'd2d3', 'd2d4', 'e2e3', 'e2e4', 'f2f3', 'f2f4',
-                  'g1f3', 'g1h3', 'g2g3', 'g2g4', 'h2h3', 'h2h4']
+                  'g1f3', 'g1h3', 'g2g3', 'g2g4', 'h2h3', 'h2h4')
+LEGAL_OPENINGS_SET = frozenset(LEGAL_OPENINGS)
 
 # set of all board positions in index form and algebraic notation
-ALG_POS = set(chr(l) + str(x) for x in range(1, 9) for l in range(97, 105))
-IDX_POS = set(range(64))
+ALG_POS = frozenset(sys.intern(chr(l) + str(x))
+                    for x in range(1, 9) for l in range(97, 105))
+IDX_POS = frozenset(range(64))
+
+# Positions for each game status
+STATUS_CASES = (
+    (START_POS, Game.NORMAL),
+    ('r3rk2/8/8/8/8/8/8/R3K2R w KQ - 0 1', Game.CHECK),
+    ('8/p5kp/1p6/2p5/P5P1/2n4P/r2p4/1K6 w - - 2 37', Game.CHECKMATE),
+    ('8/8/8/8/8/7k/5q2/7K w - - 0 37', Game.STALEMATE),
+)
+
+
+@lru_cache(maxsize=None)
+def _parsed(fen, validate=True):
+    """
+    Parse each FEN string only once; tests restore an independent copy of the
+    game with pickle.loads(), which is faster than parsing the FEN again.
+    """
+    return pickle.dumps(Game(fen=fen, validate=validate))
 
 
 class GameTest(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # every test starts from a copy of the same game in the starting
+        # position, so the default FEN is only parsed once
+        cls._proto = pickle.dumps(Game())
+
     def setUp(self):
-        self.game = Game()
+        self.game = pickle.loads(self._proto)
 
     def test_i2xy(self):
-        for idx in range(64):
-            self.assertIn(Game.i2xy(idx), ALG_POS)
+        self.assertEqual({Game.i2xy(idx) for idx in range(64)}, ALG_POS)
 
     def test_xy2i(self):
-        for pos in ALG_POS:
-            self.assertIn(Game.xy2i(pos), IDX_POS)
+        self.assertEqual({Game.xy2i(pos) for pos in ALG_POS}, IDX_POS)
 
     def test_str(self):
         self.game.reset()  # reset board to starting position
         self.assertEqual(str(self.game), START_POS)
 
+    def test_hash(self):
+        # transpositions reach the same hash as parsing the position directly
+        start_hash = self.game.hash
+        for move in ['g1f3', 'g8f6', 'f3g1', 'f6g8']:
+            self.game.apply_move(move)
+        self.assertNotEqual(str(self.game), START_POS)
+        self.assertEqual(self.game.hash, Game(fen=str(self.game)).hash)
+        self.assertEqual(self.game.hash, start_hash)  # only counters differ
+        self.game.apply_move('e2e4')
+        self.assertEqual(self.game.hash, Game(fen=str(self.game)).hash)
+
+        # the en passant file only counts when the target can be captured
+        self.assertEqual(self.game.hash, Game(fen=str(self.game).replace(
+            ' e3 ', ' - ')).hash)
+        for move in ['g8f6', 'e4e5', 'd7d5']:
+            self.game.apply_move(move)
+        self.assertNotEqual(self.game.hash, Game(fen=str(self.game).replace(
+            ' d6 ', ' - ')).hash)
+
+    def test_repetitions(self):
+        self.assertEqual(self.game.repetitions, 1)
+        for move in ['g1f3', 'g8f6', 'f3g1', 'f6g8'] * 2:
+            self.game.apply_move(move)
+        self.assertEqual(self.game.repetitions, 3)
+        self.game.apply_move('e2e4')
+        self.assertEqual(self.game.repetitions, 1)
+        self.game.reset()
+        self.assertEqual(self.game.repetitions, 1)
+
+        # an en passant target that no pawn can capture is not part of the
+        # position, so 1.e4 Nf6 2.Nf3 Ng8 3.Ng1 repeats the position after e4
+        for move in ['e2e4', 'g8f6', 'g1f3', 'f6g8', 'f3g1']:
+            self.game.apply_move(move)
+        self.assertEqual(self.game.repetitions, 2)
+
     def test_fen_history(self):
         self.game.reset()
         self.assertEqual(self.game.fen_history, [START_POS])
@@ -43,7 +106,7 @@ class GameTest(unittest.TestCase):
 
     def test_move_history(self):
         self.game = None
-        self.game = Game()
+        self.game = pickle.loads(self._proto)
         self.assertEqual(self.game.move_history, [])
         self.game.apply_move('e2e4')
         self.assertEqual(self.game.move_history, ['e2e4'])
@@ -51,46 +114,120 @@ class GameTest(unittest.TestCase):
     def test_get_moves(self):
         # legal openings
         self.game.reset()
-        self.assertEqual(sorted(self.game.get_moves()), LEGAL_OPENINGS)
+        self.assertEqual(tuple(sorted(self.game.get_moves())),
+                         LEGAL_OPENINGS)
+
+        # moves are listed by starting square, then in the order of the
+        # directions from that square (see Chessnut.moves.DIRECTIONS)
+        self.assertEqual(self.game.get_moves()[-4:],
+                         ['b1c3', 'b1a3', 'g1h3', 'g1f3'])
+        fen = '8/8/8/8/3K4/8/8/7k w - - 0 1'
+        self.game = pickle.loads(_parsed(fen))
+        self.assertEqual(self.game.get_moves(),
+                         ['d4e4', 'd4e5', 'd4d5', 'd4c5', 'd4c4', 'd4c3',
+                          'd4d3', 'd4e3'])
 
         # en passant
         fen = 'rnbqkbnr/ppp2ppp/4p3/3pP3/8/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 1'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.assertEqual(self.game.get_moves(idx_list=[28]), ['e5d6'])
 
         # checkmate
         fen = '8/p5kp/1p6/2p5/P5P1/2n4P/r2p4/1K6 w - - 2 37'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.assertEqual(self.game.get_moves(), [])
 
         # castling into occupied space & king moving into check
         fen = '8/2p5/5p2/7r/7P/3R1P2/P3R1P1/2k1K3 b - - 13 46'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.assertIn('c7c6', self.game.get_moves())
         fen = '8/8/2p2p2/7r/7P/3R1P2/P3R1P1/2k1K3 w - - 0 47'
-        self.game = Game(fen=fen, validate=False)
+        self.game = pickle.loads(_parsed(fen, False))
         self.assertNotIn('e1c1', self.game.get_moves())
 
         # castling through check
         fen = 'r3k2r/8/8/8/8/8/8/3RKR2 b kq - 0 1'
-        self.game = Game(fen=fen)
-        self.assertNotIn('e8c8', self.game.get_moves(idx_list=[4]))
-        self.assertNotIn('e8g8', self.game.get_moves(idx_list=[4]))
+        self.game = pickle.loads(_parsed(fen))
+        moves = frozenset(self.game.get_moves(idx_list=[4]))
+        self.assertTrue({'e8c8', 'e8g8'}.isdisjoint(moves))
 
         # castling out of check
         fen = 'r3rk2/8/8/8/8/8/8/R3K2R w KQ - 0 1'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.assertNotIn('e1c8', self.game.get_moves(idx_list=[60]))
 
         # Github Issue 9
         fen = 'r3kb1r/p1p2pp1/2p4p/3Pp3/6b1/2P5/PP1NN2P/R2QK1q1 w Qkq - 0 16'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.assertEqual(['d2f1', 'e2g1'], self.game.get_moves())
 
+    def test_get_moves_ordered(self):
+        # captures by value of the victim less the attacker (plus the value
+        # of any promotion), then quiet promotions by the value of the new
+        # piece, then quiet moves in their usual order
+        fen = '1n2k3/P7/8/3p4/2Q1P3/8/8/4K3 w - - 0 1'
+        self.game = pickle.loads(_parsed(fen))
+        moves = self.game.get_moves(ordered=True)
+        self.assertEqual(moves[:12], ['a7b8q', 'a7b8r', 'a7b8b', 'a7b8n',
+                                      'e4d5', 'c4d5',
+                                      'a7a8q', 'a7a8r', 'a7a8b', 'a7a8n',
+                                      'c4d4', 'c4c5'])
+        self.assertEqual(sorted(moves), sorted(self.game.get_moves()))
+
+        # en passant captures are ranked as captures of a pawn
+        fen = '4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1'
+        self.game = pickle.loads(_parsed(fen))
+        moves = self.game.get_moves(ordered=True)
+        self.assertEqual(moves[0], 'e5d6')
+
+    def test_transposition_table(self):
+        # cached move lists are reused, copied, and evicted oldest first
+        self.game.tt_size = 2
+        start_key = (self.game.hash, 'w')
+        moves = self.game.get_moves()
+        moves.append('e1e8')
+        self.assertEqual(frozenset(self.game.get_moves()),
+                         LEGAL_OPENINGS_SET)
+        self.assertEqual(list(self.game._tt), [start_key])
+
+        # single squares are answered from the cached full-board list
+        # without generating moves or adding entries to the table
+        gen_moves = self.game._gen_moves
+        self.game._gen_moves = None
+        self.assertEqual(self.game.get_moves(idx_list=[Game.xy2i('g1')]),
+                         ['g1h3', 'g1f3'])
+        self.game.apply_move('e2e4')
+        self.assertEqual(list(self.game._tt), [start_key])
+        self.game._gen_moves = gen_moves
+
+        black_key = (self.game.hash, 'b')
+        self.game.get_moves()
+        self.game.apply_move('e7e5')
+        self.game.get_moves()
+        self.assertEqual(list(self.game._tt),
+                         [black_key, (self.game.hash, 'w')])
+
+        # the table is not pickled with the game
+        self.assertEqual(pickle.loads(pickle.dumps(self.game))._tt, {})
+
+    def test_undo(self):
+        # castling, en passant, and promotion are all taken back exactly
+        fens = ['r3k2r/pppqbppp/3pb3/8/8/3PB3/PPPQBPPP/R3K2R w KQkq - 0 7',
+                '3qk1b1/P7/8/8/8/8/7P/4K3 w - - 0 1',
+                'rnbqkbnr/ppp2ppp/4p3/3pP3/8/8/PPPP1PPP/RNBQKBNR '
+                'w KQkq d6 0 1']
+        for fen in fens:
+            self.game = pickle.loads(_parsed(fen))
+            for move in self.game._all_moves():
+                self.game._do(move)
+                self.game._undo()
+                self.assertEqual(str(self.game), fen)
+                self.assertEqual(self.game.hash, Game(fen=fen).hash)
+
     def test_apply_move(self):
         # pawn promotion
         fen = '3qk1b1/P7/8/8/8/8/7P/4K3 w - - 0 1'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('a7a8q')
         self.assertEqual(str(self.game), 'Q2qk1b1/8/8/8/8/8/7P/4K3 b - - 0 1')
 
@@ -106,56 +243,56 @@ class GameTest(unittest.TestCase):
         self.game.reset(fen='Q2qk1b1/8/8/8/8/8/7P/4K3 b - - 0 1')
         self.assertEqual(self.game.get_moves(), moves)
         self.game.apply_move('d8b8')
-        moves = set(self.game.get_moves())
+        moves = frozenset(self.game.get_moves())
         self.assertIn('a8b8', moves)
         self.assertNotIn('a8c8', moves)
 
         # white castling
         fen = 'r3k2r/pppqbppp/3pb3/8/8/3PB3/PPPQBPPP/R3K2R w KQkq - 0 7'
         new_fen = 'r3k2r/pppqbppp/3pb3/8/8/3PB3/PPPQBPPP/R4RK1 b kq - 1 7'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('e1g1')
         self.assertEqual(str(self.game), new_fen)
         new_fen = 'r3k2r/pppqbppp/3pb3/8/8/3PB3/PPPQBPPP/2KR3R b kq - 1 7'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('e1c1')
         self.assertEqual(str(self.game), new_fen)
 
         # black castling
         fen = 'r3k2r/pppqbppp/3pb3/8/8/3PB3/PPPQBPPP/R3K2R b KQkq - 0 7'
         new_fen = 'r4rk1/pppqbppp/3pb3/8/8/3PB3/PPPQBPPP/R3K2R w KQ - 1 8'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('e8g8')
         self.assertEqual(str(self.game), new_fen)
         new_fen = '2kr3r/pppqbppp/3pb3/8/8/3PB3/PPPQBPPP/R3K2R w KQ - 1 8'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('e8c8')
         self.assertEqual(str(self.game), new_fen)
 
         # Disable castling on capture
         fen = '1r2k2r/3nb1Qp/p1pp4/3p4/3P4/P1N2P2/1PP3PP/R1B3K1 w k - 0 22'
         new_fen = '1r2k2Q/3nb2p/p1pp4/3p4/3P4/P1N2P2/1PP3PP/R1B3K1 b - - 0 22'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('g7h8')
         self.assertEqual(str(self.game), new_fen)
 
         # white en passant
         fen = 'rnbqkbnr/ppp2ppp/4p3/3pP3/8/8/PPPP1PPP/RNBQKBNR w KQkq d6 0 1'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('e5d6')
         new_fen = 'rnbqkbnr/ppp2ppp/3Pp3/8/8/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1'
         self.assertEqual(str(self.game), new_fen)
 
         # black en passant
         fen = 'rnbqkbnr/ppp1pppp/8/8/3pP3/8/PPPP1PPP/RNBQKBNR b KQkq e3 0 1'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('d4e3')
         new_fen = 'rnbqkbnr/ppp1pppp/8/8/8/4p3/PPPP1PPP/RNBQKBNR w KQkq - 0 2'
         self.assertEqual(str(self.game), new_fen)
 
         # capture
         fen = 'r2q1rk1/pppbbppp/2n5/3p4/3PN3/4PN2/1PPBBPPP/R2Q1RK1 b - - 0 9'
-        self.game = Game(fen=fen)
+        self.game = pickle.loads(_parsed(fen))
         self.game.apply_move('d5e4')
         n_fen = 'r2q1rk1/pppbbppp/2n5/8/3Pp3/4PN2/1PPBBPPP/R2Q1RK1 w - - 0 10'
         self.assertEqual(str(self.game), n_fen)
@@ -164,24 +301,28 @@ class GameTest(unittest.TestCase):
         self.game.reset()
         with self.assertRaises(InvalidMove):
             self.game.apply_move('e2e2')
+        with self.assertRaises(InvalidMove):
+            self.game.apply_move('e2e9')
+
+    def test_transcript(self):
+        # Morphy vs. Duke Karl / Count Isouard, Paris 1858 (the "Opera Game")
+        moves = ['e2e4', 'e7e5', 'g1f3', 'd7d6', 'd2d4', 'c8g4', 'd4e5',
+                 'g4f3', 'd1f3', 'd6e5', 'f1c4', 'g8f6', 'f3b3', 'd8e7',
+                 'b1c3', 'c7c6', 'c1g5', 'b7b5', 'c3b5', 'c6b5', 'c4b5',
+                 'b8d7', 'e1c1', 'a8d8', 'd1d7', 'd8d7', 'h1d1', 'e7e6',
+                 'b5d7', 'f6d7', 'b3b8', 'd7b8', 'd1d8']
+        apply = self.game.apply_move
+        deque(map(apply, moves), maxlen=0)
+        fen = '1n1Rkb1r/p4ppp/4q3/4p1B1/4P3/8/PPP2PPP/2K5 b k - 1 17'
+        self.assertEqual(str(self.game), fen)
+        self.assertEqual(self.game.move_history, moves)
+        self.assertEqual(self.game.status, Game.CHECKMATE)
 
     def test_status(self):
-
-        # NORMAL
-        game = Game()
-        self.assertEqual(game.status, Game.NORMAL)
-
-        # CHECK
-        game = Game(fen='r3rk2/8/8/8/8/8/8/R3K2R w KQ - 0 1')
-        self.assertEqual(game.status, game.CHECK)
-
-        # CHECKMATE
-        game = Game(fen='8/p5kp/1p6/2p5/P5P1/2n4P/r2p4/1K6 w - - 2 37')
-        self.assertEqual(game.status, Game.CHECKMATE)
-
-        # STALEMATE
-        game = Game(fen='8/8/8/8/8/7k/5q2/7K w - - 0 37')
-        self.assertEqual(game.status, Game.STALEMATE)
+        for fen, status in STATUS_CASES:
+            with self.subTest(fen=fen):
+                game = pickle.loads(_parsed(fen))
+                self.assertEqual(game.status, status)
 
     def test_last_line_pawn_check(self):
         # If a pawn is able to expose a king on its last line
@@ -1,7 +1,33 @@
 
 import unittest
+from itertools import chain
 
-from Chessnut.moves import MOVES
+from Chessnut.moves import (MOVES, MOVES_BY_CLASS, MOVE_COUNTS,
+                            SQUARE_CLASSES, gen, bishop_attacks, rook_attacks,
+                            queen_attacks)
+
+
+def _count(rays):
+    """Return the total number of moves in a tuple of rays."""
+    return sum(map(len, rays))
+
+
+def _both_cases(counts):
+    """
+    Key a dictionary of move counts by both the black (lowercase) and white
+    (uppercase) symbol of each piece.
+    """
+    return {s: n for p, n in counts.items() for s in (p, p.upper())}
+
+
+# Expected number of moves (or bounds on the number of moves) for each piece
+# from the squares in each class
+EXPECTED_CORNER = _both_cases({'p': 0, 'k': 3, 'q': 21, 'b': 7, 'n': 2,
+                               'r': 14})
+EDGE_MIN = _both_cases({'p': 0, 'k': 5, 'q': 21, 'b': 7, 'n': 3, 'r': 14})
+EDGE_MAX = _both_cases({'p': 3, 'k': 7, 'q': 21, 'b': 7, 'n': 4, 'r': 14})
+CENTER_MIN = _both_cases({'p': 3, 'k': 8, 'q': 23, 'b': 9, 'n': 4, 'r': 14})
+CENTER_MAX = _both_cases({'p': 4, 'k': 8, 'q': 27, 'b': 13, 'n': 8, 'r': 14})
 
 
 class MovesTest(unittest.TestCase):
@@ -20,11 +46,77 @@ class MovesTest(unittest.TestCase):
                 # test ordering of moves in each ray (should radiate out
                 # from the starting index)
                 for ray in MOVES[piece][idx]:
-                    sorted_ray = sorted(ray, key=lambda x: abs(x - idx))
-                    self.assertEqual(ray, sorted_ray)
+                    prev = -1
+                    for end in ray:
+                        dist = abs(end - idx)
+                        self.assertGreaterEqual(dist, prev)
+                        prev = dist
 
         # verify that castling moves are present
         self.assertIn(6, MOVES['k'][4][0])
         self.assertIn(2, MOVES['k'][4][1])
         self.assertIn(62, MOVES['K'][60][0])
         self.assertIn(58, MOVES['K'][60][4])
+
+    def test_table(self):
+        # the precomputed table must match the rays built by gen()
+        for idx in range(64):
+            moves = gen(idx)
+            for piece in MOVES:
+                self.assertEqual(MOVES[piece][idx], moves[piece])
+
+    def test_attacks(self):
+        # on an empty board the attacks cover the rays in MOVES
+        for idx in range(64):
+            for sym, attacks in [('b', bishop_attacks), ('r', rook_attacks),
+                                 ('q', queen_attacks)]:
+                ends = {end for ray in MOVES[sym][idx] for end in ray}
+                self.assertEqual(attacks(idx), sum(1 << end for end in ends))
+
+        # rays stop at (and include) the nearest blocking piece; a rook on
+        # 'd4' (idx = 35) blocked on 'd6' and 'b4'
+        occupied = 1 << 19 | 1 << 33
+        ends = [19, 27, 33, 34, 36, 37, 38, 39, 43, 51, 59]
+        self.assertEqual(rook_attacks(35, occupied),
+                         sum(1 << end for end in ends))
+
+    def test_corner(self):
+        for sym, squares in MOVES_BY_CLASS['corner'].items():
+            for idx in squares:
+                n = MOVE_COUNTS[sym][idx]
+                self.assertEqual(n, EXPECTED_CORNER[sym],
+                                 '{} at {}'.format(sym, idx))
+
+    def test_edge(self):
+        for sym, squares in MOVES_BY_CLASS['edge'].items():
+            for idx in squares:
+                with self.subTest(idx=idx, sym=sym):
+                    n = MOVE_COUNTS[sym][idx]
+                    self.assertLessEqual(n, EDGE_MAX[sym])
+                    self.assertGreaterEqual(n, EDGE_MIN[sym])
+
+    def test_center(self):
+        for sym, squares in MOVES_BY_CLASS['center'].items():
+            for idx in squares:
+                with self.subTest(idx=idx, sym=sym):
+                    n = MOVE_COUNTS[sym][idx]
+                    self.assertLessEqual(n, CENTER_MAX[sym])
+                    self.assertGreaterEqual(n, CENTER_MIN[sym])
+
+    def test_exceptions(self):
+        # pawns (away from the edges) can advance two squares from their
+        # starting rank; the advance is the middle of their three rays
+        for i in range(6):
+            self.assertEqual(list(MOVES['p'][9 + i][1]), [17 + i, 25 + i])
+            self.assertEqual(list(MOVES['P'][49 + i][1]), [41 + i, 33 + i])
+
+    def test_counts(self):
+        for sym in MOVES:
+            for idx in range(64):
+                n = _count(MOVES[sym][idx])
+                self.assertEqual(MOVE_COUNTS[sym][idx], n)
+
+    def test_classes(self):
+        # the classes partition the board
+        squares = sorted(chain.from_iterable(SQUARE_CLASSES.values()))
+        self.assertEqual(squares, list(range(64)))
@@ -0,0 +1,52 @@
+"""
+Zobrist keys used to hash chess positions.
+
+A Zobrist hash is the XOR of one random 64-bit key for each piece on the board
+(indexed by the piece's position in `Chessnut.board.PIECES` and its square),
+plus keys for each available castling right, the file of a capturable en
+passant target square, and the side to move. Because XOR is its own inverse,
+the hash can be updated incrementally when a piece moves by XORing out the key
+for the old square and XORing in the key for the new square.
+
+The keys are generated from a fixed seed so that hashes are reproducible
+between runs of the program.
+"""
+
+from random import Random
+
+from Chessnut.moves import PAWN_ATTACKS
+
+_RNG = Random(0x4368657373)
+
+ZOBRIST_PSQ = [[_RNG.getrandbits(64) for _ in range(64)] for _ in range(12)]
+ZOBRIST_CASTLE = {sym: _RNG.getrandbits(64) for sym in 'KQkq'}
+ZOBRIST_EP_FILE = [_RNG.getrandbits(64) for _ in range(8)]
+ZOBRIST_SIDE = _RNG.getrandbits(64)
+
+
+def state_key(state, board):
+    """
+    Return the part of the hash that depends on the game state (i.e., the
+    active player, castling rights, and en passant target square) rather than
+    the position of the pieces.
+
+    As in Polyglot, the en passant file is only hashed when a pawn of the
+    active player on the board can actually capture on the target square, so
+    positions that differ only by an unusable en passant target are treated
+    as the same position.
+    """
+    key = ZOBRIST_SIDE if state.player == 'b' else 0
+    for sym in state.rights:
+        key ^= ZOBRIST_CASTLE.get(sym, 0)
+    if state.en_passant != '-':
+        ep_file = ord(state.en_passant[0]) - ord('a')
+        index = (8 - int(state.en_passant[1])) * 8 + ep_file
+        # a pawn captures onto the target from the squares that an enemy
+        # pawn standing on the target would attack
+        if state.player == 'w':
+            capturable = PAWN_ATTACKS['b'][index] & board.bb[0]
+        else:
+            capturable = PAWN_ATTACKS['w'][index] & board.bb[6]
+        if capturable:
+            key ^= ZOBRIST_EP_FILE[ep_file]
+    return key
@@ -2,7 +2,7 @@
 
 usage() {
     echo `basename $0`: ERROR: $* 1>&2
-    echo usage: `basename $0` '[--pylint | --unittest]' 1>&2
+    echo usage: `basename $0` '[--pylint | --unittest | --parallel]' 1>&2
     exit 1
 }
 
@@ -12,6 +12,7 @@ do
     --pylint) pylint --ignore=tests Chessnut;;
     --unittest) coverage run  -m unittest discover; coverage html; open htmlcov/index.html
 ;;
+    --parallel) python -m pytest -n auto Chessnut/tests;;
     -*) usage "bad argument $1";;
     *) break;;
     esac
@@ -0,0 +1,43 @@
+"""
+Regenerate `Chessnut/_moves_table.py`, the precomputed copy of
+`Chessnut.moves.MOVES` that is loaded when the package is imported.
+
+Run this script from the root of the repository after changing the way that
+`Chessnut.moves.gen()` builds the rays:
+
+    python tools/gen_moves_table.py
+"""
+
+import os
+import sys
+from pprint import pformat
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TABLE = os.path.join(ROOT, 'Chessnut', '_moves_table.py')
+
+HEADER = '''\
+"""
+Precomputed rays for each type of piece from every square of the board; see
+`Chessnut.moves` for a description of the structure.
+
+This file is generated by tools/gen_moves_table.py from Chessnut.moves.gen()
+-- do not edit it by hand.
+"""
+
+'''
+
+
+def main():
+    sys.path.insert(0, ROOT)
+    from Chessnut.moves import gen
+
+    squares = [gen(idx) for idx in range(64)]
+    moves = {sym: tuple(moves[sym] for moves in squares) for sym in squares[0]}
+
+    with open(TABLE, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        f.write('MOVES = ' + pformat(moves, width=79, sort_dicts=False) + '\n')
+
+
+if __name__ == '__main__':
+    main()